@@ -6,20 +6,21 @@
 # pylint:disable=specify-parameter-names-in-call
 # pylint:disable=too-many-lines
 import functools
-from typing import TYPE_CHECKING, Any, Union, cast
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union, cast
 from xml.etree.ElementTree import ElementTree
 
 from azure.core.async_paging import AsyncItemPaged
 from azure.core.exceptions import ResourceNotFoundError
 from azure.core.pipeline import AsyncPipeline
-from azure.core.pipeline.policies import HttpLoggingPolicy, DistributedTracingPolicy, ContentDecodePolicy, \
-    RequestIdPolicy, AsyncBearerTokenCredentialPolicy
+from azure.core.pipeline.policies import HttpLoggingPolicy, DistributedTracingPolicy, RequestIdPolicy, \
+    AsyncBearerTokenCredentialPolicy
 from azure.core.pipeline.transport import AioHttpTransport
 
-from ...management._generated.models import QueueDescriptionFeed, TopicDescriptionEntry, \
-    QueueDescriptionEntry, SubscriptionDescriptionFeed, SubscriptionDescriptionEntry, RuleDescriptionEntry, \
-    RuleDescriptionFeed, NamespacePropertiesEntry, CreateTopicBody, CreateTopicBodyContent, \
-    TopicDescriptionFeed, CreateSubscriptionBody, CreateSubscriptionBodyContent, CreateRuleBody, \
+from ...management._generated.models import TopicDescriptionEntry, \
+    QueueDescriptionEntry, SubscriptionDescriptionEntry, RuleDescriptionEntry, \
+    NamespacePropertiesEntry, CreateTopicBody, CreateTopicBodyContent, \
+    CreateSubscriptionBody, CreateSubscriptionBodyContent, CreateRuleBody, \
     CreateRuleBodyContent, CreateQueueBody, CreateQueueBodyContent
 
 from ..._common.utils import parse_conn_str
@@ -33,15 +34,37 @@ from ._shared_key_policy_async import AsyncServiceBusSharedKeyCredentialPolicy
 from ...management._models import QueueRuntimeProperties, QueueProperties, TopicProperties, TopicRuntimeProperties, \
     SubscriptionProperties, SubscriptionRuntimeProperties, RuleProperties, NamespaceProperties
 from ...management._xml_workaround_policy import ServiceBusXMLWorkaroundPolicy
+from ...management._xml_decode_policy import ServiceBusXMLDecodePolicy
 from ...management._handle_response_error import _handle_response_error
 from ...management._model_workaround import avoid_timedelta_overflow
 from ._utils import extract_data_template, extract_rule_data_template, get_next_template
-from ...management._utils import deserialize_rule_key_values, serialize_rule_key_values
+from ...management._utils import deserialize_rule_key_values, serialize_rule_key_values, entry_to_queue, \
+    entry_to_queue_runtime_properties, entry_to_topic, entry_to_topic_runtime_properties, entry_to_subscription, \
+    entry_to_subscription_runtime_properties, entry_to_rule, deserialize_entry
 
 
 if TYPE_CHECKING:
     from azure.core.credentials_async import AsyncTokenCredential  # pylint:disable=ungrouped-imports
 
+# These policies keep no state between requests, so clients built without options for them share one instance of each.
+_REQUEST_ID_POLICY = RequestIdPolicy()
+_XML_DECODE_POLICY = ServiceBusXMLDecodePolicy()
+_XML_WORKAROUND_POLICY = ServiceBusXMLWorkaroundPolicy()
+_DISTRIBUTED_TRACING_POLICY = DistributedTracingPolicy()
+
+# The list_* pagers share these page extractors; they hold no per-call state.
+_EXTRACT_QUEUES = functools.partial(extract_data_template, QueueDescriptionEntry, entry_to_queue)
+_EXTRACT_QUEUES_RUNTIME_PROPERTIES = functools.partial(
+    extract_data_template, QueueDescriptionEntry, entry_to_queue_runtime_properties)
+_EXTRACT_TOPICS = functools.partial(extract_data_template, TopicDescriptionEntry, entry_to_topic)
+_EXTRACT_TOPICS_RUNTIME_PROPERTIES = functools.partial(
+    extract_data_template, TopicDescriptionEntry, entry_to_topic_runtime_properties)
+_EXTRACT_SUBSCRIPTIONS = functools.partial(
+    extract_data_template, SubscriptionDescriptionEntry, entry_to_subscription)
+_EXTRACT_SUBSCRIPTIONS_RUNTIME_PROPERTIES = functools.partial(
+    extract_data_template, SubscriptionDescriptionEntry, entry_to_subscription_runtime_properties)
+_EXTRACT_RULES = functools.partial(extract_rule_data_template, RuleDescriptionEntry, entry_to_rule)
+
 
 class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
     """Use this client to create, update, list, and delete resources of a ServiceBus namespace.
@@ -49,6 +72,11 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
     :param str fully_qualified_namespace: The fully qualified host name for the Service Bus namespace.
     :param credential: To authenticate to manage the entities of the ServiceBus namespace.
     :type credential: AsyncTokenCredential
+    :keyword float entity_cache_ttl: The number of seconds for which `get_queue` and `get_topic` may return
+     properties from an earlier response instead of sending a request. By default nothing is cached.
+     Only calls made without keyword arguments are cached, and entities that were not found are never cached.
+     Changes made through this client clear the cached entity, but changes made elsewhere may be missed until
+     the cached response expires.
     """
 
     def __init__(
@@ -59,8 +87,10 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
         self.fully_qualified_namespace = fully_qualified_namespace
         self._credential = credential
         self._endpoint = "https://" + fully_qualified_namespace
+        self._entity_cache_ttl = kwargs.pop("entity_cache_ttl", None)  # type: Optional[float]
+        self._entity_cache = {}  # type: Dict[str, Tuple[float, ElementTree]]
         self._config = ServiceBusManagementClientConfiguration(self._endpoint, **kwargs)
-        self._pipeline = self._build_pipeline()
+        self._pipeline = self._build_pipeline(**kwargs)
         self._impl = ServiceBusManagementClientImpl(endpoint=fully_qualified_namespace, pipeline=self._pipeline)
 
     async def __aenter__(self) -> "ServiceBusAdministrationClient":
@@ -78,18 +108,24 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
             if isinstance(self._credential, ServiceBusSharedKeyCredential) \
             else AsyncBearerTokenCredentialPolicy(self._credential, JWT_TOKEN_SCOPE)
         if policies is None:  # [] is a valid policy list
+            request_id_policy = RequestIdPolicy(**kwargs) \
+                if "request_id" in kwargs or "auto_request_id" in kwargs else _REQUEST_ID_POLICY
+            xml_decode_policy = ServiceBusXMLDecodePolicy(**kwargs) \
+                if "response_encoding" in kwargs else _XML_DECODE_POLICY
+            distributed_tracing_policy = DistributedTracingPolicy(**kwargs) \
+                if "tracing_attributes" in kwargs or "network_span_namer" in kwargs else _DISTRIBUTED_TRACING_POLICY
             policies = [
-                RequestIdPolicy(**kwargs),
+                request_id_policy,
                 self._config.headers_policy,
                 self._config.user_agent_policy,
                 self._config.proxy_policy,
-                ContentDecodePolicy(**kwargs),
-                ServiceBusXMLWorkaroundPolicy(),
+                xml_decode_policy,
+                _XML_WORKAROUND_POLICY,
                 self._config.redirect_policy,
                 self._config.retry_policy,
                 credential_policy,
                 self._config.logging_policy,
-                DistributedTracingPolicy(**kwargs),
+                distributed_tracing_policy,
                 HttpLoggingPolicy(**kwargs),
             ]
         if not transport:
@@ -106,6 +142,27 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
             )
         return element
 
+    async def _get_cached_entity_element(self, entity_name, **kwargs):
+        # type: (str, Any) -> ElementTree
+        ttl = self._entity_cache_ttl
+        # Keyword arguments such as headers or timeout may change the response, so those calls bypass the cache.
+        if not ttl or kwargs:
+            return await self._get_entity_element(entity_name, **kwargs)
+        now = time.monotonic()
+        cached = self._entity_cache.get(entity_name)
+        if cached:
+            if cached[0] > now:
+                return cached[1]
+            self._entity_cache.pop(entity_name, None)
+        element = await self._get_entity_element(entity_name)
+        # A missing entity comes back as an empty feed rather than an entry; don't cache it.
+        if element is not None and element.find(constants.ATOM_CONTENT_TAG) is not None:
+            for name, (expiry, _) in list(self._entity_cache.items()):
+                if expiry <= now:
+                    self._entity_cache.pop(name, None)
+            self._entity_cache[entity_name] = (now + ttl, element)
+        return element
+
     async def _get_subscription_element(self, topic_name, subscription_name, enrich=False, **kwargs):
         # type: (str, str, bool, Any) -> ElementTree
 
@@ -140,8 +197,9 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
             credential = ServiceBusSASTokenCredential(token, token_expiry)
         elif shared_access_key_name and shared_access_key:
             credential = ServiceBusSharedKeyCredential(shared_access_key_name, shared_access_key) # type: ignore
-        if "//" in endpoint:
-            endpoint = endpoint[endpoint.index("//")+2:]
+        left_slash_pos = endpoint.find("//")
+        if left_slash_pos != -1:
+            endpoint = endpoint[left_slash_pos + 2:]
         return cls(endpoint, credential, **kwargs) # type: ignore
 
     async def get_queue(self, queue_name: str, **kwargs) -> QueueProperties:
@@ -150,8 +208,8 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
         :param str queue_name: The name of the queue.
         :rtype: ~azure.servicebus.management.QueueProperties
         """
-        entry_ele = await self._get_entity_element(queue_name, **kwargs)
-        entry = QueueDescriptionEntry.deserialize(entry_ele)
+        entry_ele = await self._get_cached_entity_element(queue_name, **kwargs)
+        entry = deserialize_entry(QueueDescriptionEntry, entry_ele)
         if not entry.content:
             raise ResourceNotFoundError("Queue '{}' does not exist".format(queue_name))
         queue_description = QueueProperties._from_internal_entity(queue_name,
@@ -165,7 +223,7 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
         :rtype: ~azure.servicebus.management.QueueRuntimeProperties
         """
         entry_ele = await self._get_entity_element(queue_name, **kwargs)
-        entry = QueueDescriptionEntry.deserialize(entry_ele)
+        entry = deserialize_entry(QueueDescriptionEntry, entry_ele)
         if not entry.content:
             raise ResourceNotFoundError("Queue {} does not exist".format(queue_name))
         runtime_properties = QueueRuntimeProperties._from_internal_entity(queue_name,
@@ -256,7 +314,8 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
                 queue_description=to_create,  # type: ignore
             )
         )
-        request_body = create_entity_body.serialize(is_xml=True)
+        # Model.serialize builds a new Serializer on every call; reuse the one the generated client holds.
+        request_body = self._impl._serialize._serialize(create_entity_body, is_xml=True)
         with _handle_response_error():
             entry_ele = cast(
                 ElementTree,
@@ -264,8 +323,9 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
                     name,  # type: ignore
                     request_body, api_version=constants.API_VERSION, **kwargs)
             )
+        self._entity_cache.pop(name, None)
 
-        entry = QueueDescriptionEntry.deserialize(entry_ele)
+        entry = deserialize_entry(QueueDescriptionEntry, entry_ele)
         result = QueueProperties._from_internal_entity(name,
             entry.content.queue_description)
         return result
@@ -292,7 +352,7 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
                 queue_description=to_update,
             )
         )
-        request_body = create_entity_body.serialize(is_xml=True)
+        request_body = self._impl._serialize._serialize(create_entity_body, is_xml=True)
         with _handle_response_error():
             await self._impl.entity.put(
                 queue.name,  # type: ignore
@@ -301,6 +361,7 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
                 if_match="*",
                 **kwargs
             )
+        self._entity_cache.pop(queue.name, None)
 
     async def delete_queue(self, queue: Union[str, QueueProperties], **kwargs) -> None:
         """Delete a queue.
@@ -317,6 +378,7 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
             raise ValueError("queue_name must not be None or empty")
         with _handle_response_error():
             await self._impl.entity.delete(queue_name, api_version=constants.API_VERSION, **kwargs)
+        self._entity_cache.pop(queue_name, None)
 
     def list_queues(self, **kwargs: Any) -> AsyncItemPaged[QueueProperties]:
         """List the queues of a ServiceBus namespace.
@@ -324,19 +386,12 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
         :returns: An iterable (auto-paging) response of QueueProperties.
         :rtype: ~azure.core.async_paging.AsyncItemPaged[~azure.servicebus.management.QueueProperties]
         """
-
-        def entry_to_qd(entry):
-            qd = QueueProperties._from_internal_entity(entry.title, entry.content.queue_description)
-            return qd
-
-        extract_data = functools.partial(
-            extract_data_template, QueueDescriptionFeed, entry_to_qd
-        )
         get_next = functools.partial(
-            get_next_template, functools.partial(self._impl.list_entities, constants.ENTITY_TYPE_QUEUES), **kwargs
+            get_next_template, self._impl.list_entities,
+            entity_type=constants.ENTITY_TYPE_QUEUES, **kwargs
         )
         return AsyncItemPaged(
-            get_next, extract_data)
+            get_next, _EXTRACT_QUEUES)
 
     def list_queues_runtime_properties(self, **kwargs: Any) -> AsyncItemPaged[QueueRuntimeProperties]:
         """List the runtime information of the queues in a ServiceBus namespace.
@@ -344,19 +399,12 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
         :returns: An iterable (auto-paging) response of QueueRuntimeProperties.
         :rtype: ~azure.core.async_paging.AsyncItemPaged[~azure.servicebus.management.QueueRuntimeProperties]
         """
-
-        def entry_to_qr(entry):
-            qd = QueueRuntimeProperties._from_internal_entity(entry.title, entry.content.queue_description)
-            return qd
-
-        extract_data = functools.partial(
-            extract_data_template, QueueDescriptionFeed, entry_to_qr
-        )
         get_next = functools.partial(
-            get_next_template, functools.partial(self._impl.list_entities, constants.ENTITY_TYPE_QUEUES), **kwargs
+            get_next_template, self._impl.list_entities,
+            entity_type=constants.ENTITY_TYPE_QUEUES, **kwargs
         )
         return AsyncItemPaged(
-            get_next, extract_data)
+            get_next, _EXTRACT_QUEUES_RUNTIME_PROPERTIES)
 
     async def get_topic(self, topic_name: str, **kwargs) -> TopicProperties:
         """Get the properties of a topic.
@@ -364,8 +412,8 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
         :param str topic_name: The name of the topic.
         :rtype: ~azure.servicebus.management.TopicDescription
         """
-        entry_ele = await self._get_entity_element(topic_name, **kwargs)
-        entry = TopicDescriptionEntry.deserialize(entry_ele)
+        entry_ele = await self._get_cached_entity_element(topic_name, **kwargs)
+        entry = deserialize_entry(TopicDescriptionEntry, entry_ele)
         if not entry.content:
             raise ResourceNotFoundError("Topic '{}' does not exist".format(topic_name))
         topic_description = TopicProperties._from_internal_entity(topic_name, entry.content.topic_description)
@@ -378,7 +426,7 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
         :rtype: ~azure.servicebus.management.TopicRuntimeProperties
         """
         entry_ele = await self._get_entity_element(topic_name, **kwargs)
-        entry = TopicDescriptionEntry.deserialize(entry_ele)
+        entry = deserialize_entry(TopicDescriptionEntry, entry_ele)
         if not entry.content:
             raise ResourceNotFoundError("Topic {} does not exist".format(topic_name))
         topic_description = TopicRuntimeProperties._from_internal_entity(topic_name, entry.content.topic_description)
@@ -453,7 +501,7 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
                 topic_description=to_create,  # type: ignore
             )
         )
-        request_body = create_entity_body.serialize(is_xml=True)
+        request_body = self._impl._serialize._serialize(create_entity_body, is_xml=True)
         with _handle_response_error():
             entry_ele = cast(
                 ElementTree,
@@ -461,7 +509,8 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
                     name,  # type: ignore
                     request_body, api_version=constants.API_VERSION, **kwargs)
             )
-        entry = TopicDescriptionEntry.deserialize(entry_ele)
+        self._entity_cache.pop(name, None)
+        entry = deserialize_entry(TopicDescriptionEntry, entry_ele)
         result = TopicProperties._from_internal_entity(name, entry.content.topic_description)
         return result
 
@@ -488,7 +537,7 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
                 topic_description=to_update,
             )
         )
-        request_body = create_entity_body.serialize(is_xml=True)
+        request_body = self._impl._serialize._serialize(create_entity_body, is_xml=True)
         with _handle_response_error():
             await self._impl.entity.put(
                 topic.name,  # type: ignore
@@ -497,6 +546,7 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
                 if_match="*",
                 **kwargs
             )
+        self._entity_cache.pop(topic.name, None)
 
     async def delete_topic(self, topic: Union[str, TopicProperties], **kwargs) -> None:
         """Delete a topic.
@@ -509,6 +559,7 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
         except AttributeError:
             topic_name = topic
         await self._impl.entity.delete(topic_name, api_version=constants.API_VERSION, **kwargs)
+        self._entity_cache.pop(topic_name, None)
 
     def list_topics(self, **kwargs: Any) -> AsyncItemPaged[TopicProperties]:
         """List the topics of a ServiceBus namespace.
@@ -516,18 +567,12 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
         :returns: An iterable (auto-paging) response of TopicProperties.
         :rtype: ~azure.core.async_paging.AsyncItemPaged[~azure.servicebus.management.TopicProperties]
         """
-        def entry_to_topic(entry):
-            topic = TopicProperties._from_internal_entity(entry.title, entry.content.topic_description)
-            return topic
-
-        extract_data = functools.partial(
-            extract_data_template, TopicDescriptionFeed, entry_to_topic
-        )
         get_next = functools.partial(
-            get_next_template, functools.partial(self._impl.list_entities, constants.ENTITY_TYPE_TOPICS), **kwargs
+            get_next_template, self._impl.list_entities,
+            entity_type=constants.ENTITY_TYPE_TOPICS, **kwargs
         )
         return AsyncItemPaged(
-            get_next, extract_data)
+            get_next, _EXTRACT_TOPICS)
 
     def list_topics_runtime_properties(self, **kwargs: Any) -> AsyncItemPaged[TopicRuntimeProperties]:
         """List the topics runtime information of a ServiceBus namespace.
@@ -535,18 +580,12 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
         :returns: An iterable (auto-paging) response of TopicRuntimeProperties.
         :rtype: ~azure.core.async_paging.AsyncItemPaged[~azure.servicebus.management.TopicRuntimeProperties]
         """
-        def entry_to_topic(entry):
-            topic = TopicRuntimeProperties._from_internal_entity(entry.title, entry.content.topic_description)
-            return topic
-
-        extract_data = functools.partial(
-            extract_data_template, TopicDescriptionFeed, entry_to_topic
-        )
         get_next = functools.partial(
-            get_next_template, functools.partial(self._impl.list_entities, constants.ENTITY_TYPE_TOPICS), **kwargs
+            get_next_template, self._impl.list_entities,
+            entity_type=constants.ENTITY_TYPE_TOPICS, **kwargs
         )
         return AsyncItemPaged(
-            get_next, extract_data)
+            get_next, _EXTRACT_TOPICS_RUNTIME_PROPERTIES)
 
     async def get_subscription(
             self, topic: Union[str, TopicProperties], subscription_name: str, **kwargs
@@ -562,7 +601,7 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
         except AttributeError:
             topic_name = topic
         entry_ele = await self._get_subscription_element(topic_name, subscription_name, **kwargs)
-        entry = SubscriptionDescriptionEntry.deserialize(entry_ele)
+        entry = deserialize_entry(SubscriptionDescriptionEntry, entry_ele)
         if not entry.content:
             raise ResourceNotFoundError(
                 "Subscription('Topic: {}, Subscription: {}') does not exist".format(subscription_name, topic_name))
@@ -584,7 +623,7 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
         except AttributeError:
             topic_name = topic
         entry_ele = await self._get_subscription_element(topic_name, subscription_name, **kwargs)
-        entry = SubscriptionDescriptionEntry.deserialize(entry_ele)
+        entry = deserialize_entry(SubscriptionDescriptionEntry, entry_ele)
         if not entry.content:
             raise ResourceNotFoundError(
                 "Subscription('Topic: {}, Subscription: {}') does not exist".format(subscription_name, topic_name))
@@ -666,7 +705,7 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
                 subscription_description=to_create,  # type: ignore
             )
         )
-        request_body = create_entity_body.serialize(is_xml=True)
+        request_body = self._impl._serialize._serialize(create_entity_body, is_xml=True)
         with _handle_response_error():
             entry_ele = cast(
                 ElementTree,
@@ -676,7 +715,7 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
                     request_body, api_version=constants.API_VERSION, **kwargs)
             )
 
-        entry = SubscriptionDescriptionEntry.deserialize(entry_ele)
+        entry = deserialize_entry(SubscriptionDescriptionEntry, entry_ele)
         result = SubscriptionProperties._from_internal_entity(
             name, entry.content.subscription_description)
         return result
@@ -709,7 +748,7 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
                 subscription_description=to_update,
             )
         )
-        request_body = create_entity_body.serialize(is_xml=True)
+        request_body = self._impl._serialize._serialize(create_entity_body, is_xml=True)
         with _handle_response_error():
             await self._impl.subscription.put(
                 topic_name,
@@ -752,20 +791,11 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
             topic_name = topic.name  # type: ignore
         except AttributeError:
             topic_name = topic
-
-        def entry_to_subscription(entry):
-            subscription = SubscriptionProperties._from_internal_entity(
-                entry.title, entry.content.subscription_description)
-            return subscription
-
-        extract_data = functools.partial(
-            extract_data_template, SubscriptionDescriptionFeed, entry_to_subscription
-        )
         get_next = functools.partial(
-            get_next_template, functools.partial(self._impl.list_subscriptions, topic_name), **kwargs
+            get_next_template, self._impl.list_subscriptions, topic_name=topic_name, **kwargs
         )
         return AsyncItemPaged(
-            get_next, extract_data)
+            get_next, _EXTRACT_SUBSCRIPTIONS)
 
     def list_subscriptions_runtime_properties(
             self, topic: Union[str, TopicProperties], **kwargs: Any) -> AsyncItemPaged[SubscriptionRuntimeProperties]:
@@ -779,20 +809,11 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
             topic_name = topic.name  # type: ignore
         except AttributeError:
             topic_name = topic
-
-        def entry_to_subscription(entry):
-            subscription = SubscriptionRuntimeProperties._from_internal_entity(
-                entry.title, entry.content.subscription_description)
-            return subscription
-
-        extract_data = functools.partial(
-            extract_data_template, SubscriptionDescriptionFeed, entry_to_subscription
-        )
         get_next = functools.partial(
-            get_next_template, functools.partial(self._impl.list_subscriptions, topic_name), **kwargs
+            get_next_template, self._impl.list_subscriptions, topic_name=topic_name, **kwargs
         )
         return AsyncItemPaged(
-            get_next, extract_data)
+            get_next, _EXTRACT_SUBSCRIPTIONS_RUNTIME_PROPERTIES)
 
     async def get_rule(
             self, topic: Union[str, TopicProperties], subscription: Union[str, SubscriptionProperties],
@@ -814,7 +835,7 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
         except AttributeError:
             subscription_name = subscription
         entry_ele = await self._get_rule_element(topic_name, subscription_name, rule_name, **kwargs)
-        entry = RuleDescriptionEntry.deserialize(entry_ele)
+        entry = deserialize_entry(RuleDescriptionEntry, entry_ele)
         if not entry.content:
             raise ResourceNotFoundError(
                 "Rule('Topic: {}, Subscription: {}, Rule {}') does not exist".format(
@@ -863,7 +884,7 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
                 rule_description=to_create,  # type: ignore
             )
         )
-        request_body = create_entity_body.serialize(is_xml=True)
+        request_body = self._impl._serialize._serialize(create_entity_body, is_xml=True)
         serialize_rule_key_values(request_body, rule)
         with _handle_response_error():
             entry_ele = await self._impl.rule.put(
@@ -871,7 +892,7 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
                 subscription_name,  # type: ignore
                 name,
                 request_body, api_version=constants.API_VERSION, **kwargs)
-        entry = RuleDescriptionEntry.deserialize(entry_ele)
+        entry = deserialize_entry(RuleDescriptionEntry, entry_ele)
         result = RuleProperties._from_internal_entity(name, entry.content.rule_description)
         deserialize_rule_key_values(entry_ele, result)  # to remove after #3535 is released.
         return result
@@ -908,7 +929,7 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
                 rule_description=to_update,
             )
         )
-        request_body = create_entity_body.serialize(is_xml=True)
+        request_body = self._impl._serialize._serialize(create_entity_body, is_xml=True)
         serialize_rule_key_values(request_body, rule)
         with _handle_response_error():
             await self._impl.rule.put(
@@ -969,24 +990,12 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
             subscription_name = subscription.name  # type: ignore
         except AttributeError:
             subscription_name = subscription
-
-        def entry_to_rule(ele, entry):
-            """
-            `ele` will be removed after #3535 is released.
-            """
-            rule = entry.content.rule_description
-            rule_description = RuleProperties._from_internal_entity(entry.title, rule)
-            deserialize_rule_key_values(ele, rule_description)  # to remove after #3535 is released.
-            return rule_description
-
-        extract_data = functools.partial(
-            extract_rule_data_template, RuleDescriptionFeed, entry_to_rule
-        )
         get_next = functools.partial(
-            get_next_template, functools.partial(self._impl.list_rules, topic_name, subscription_name), **kwargs
+            get_next_template, self._impl.list_rules,
+            topic_name=topic_name, subscription_name=subscription_name, **kwargs
         )
         return AsyncItemPaged(
-            get_next, extract_data)
+            get_next, _EXTRACT_RULES)
 
     async def get_namespace_properties(self, **kwargs) -> NamespaceProperties:
         """Get the namespace properties
@@ -994,7 +1003,7 @@ class ServiceBusAdministrationClient:  #pylint:disable=too-many-public-methods
         :rtype: ~azure.servicebus.management.NamespaceProperties
         """
         entry_el = await self._impl.namespace.get(api_version=constants.API_VERSION, **kwargs)
-        namespace_entry = NamespacePropertiesEntry.deserialize(entry_el)
+        namespace_entry = deserialize_entry(NamespacePropertiesEntry, entry_el)
         return NamespaceProperties._from_internal_entity(namespace_entry.title,
                                                          namespace_entry.content.namespace_properties)
 
@@ -10,6 +10,7 @@ import urllib.parse as urlparse
 
 from azure.servicebus.management import _constants as constants
 from ...management._handle_response_error import _handle_response_error
+from ...management._utils import get_next_link, iter_entries, iter_rule_entries
 
 # This module defines functions get_next_template and extract_data_template.
 # Application code uses functools.partial to substantialize their params and builds an
@@ -19,8 +20,9 @@ from ...management._handle_response_error import _handle_response_error
 # Tag <feed> has 2 (the page size) children <entry> tags.
 # Tag <link rel="next" .../> tells the link to the next page.
 # The whole XML will be deserialized into an XML ElementTree.
-# Then model class QueueDescriptionFeed deserializes the ElementTree into a QueueDescriptionFeed instance.
-# (QueueDescriptionFeed is defined in file ../../management/_generated/models/_models.py and _models_py3.py)
+# Then model class QueueDescriptionEntry deserializes each <entry> of the ElementTree into a QueueDescriptionEntry
+# instance as the pager reaches it.
+# (QueueDescriptionEntry is defined in file ../../management/_generated/models/_models.py and _models_py3.py)
 # Function get_next_template gets the next page of XML data like this one and returns the ElementTree.
 # Function extract_data_template deserialize data from the ElementTree and provide link to the next page.
 # azure.core.async_paging.AsyncItemPaged orchestrates the data flow between them.
@@ -70,26 +72,21 @@ from ...management._handle_response_error import _handle_response_error
 # 	</entry>
 # </feed>
 
-async def extract_data_template(feed_class, convert, feed_element):
+async def extract_data_template(entry_class, convert, feed_element):
     """A function that will be partialized to build a function used by AsyncItemPaged.
 
-    It deserializes the ElementTree returned from function `get_next_template`, returns data in an iterator and
-    the link to next page.
+    It returns the link to next page and an iterator that deserializes the <entry> elements of the ElementTree
+    returned from function `get_next_template` one at a time.
 
     azure.core.async_paging.AsyncItemPaged will use the returned next page to call a partial function created
     from `get_next_template` to fetch data of next page.
 
     """
-    deserialized = feed_class.deserialize(feed_element)
-    list_of_qd = [convert(x) if convert else x for x in deserialized.entry]
-    next_link = None
-    # when the response xml has two <link> tags, the 2nd if the next-page link.
-    if deserialized.link and len(deserialized.link) == 2:
-        next_link = deserialized.link[1].href
-    return next_link, iter(list_of_qd)  # when next_page is None, AsyncPagedItem will stop fetch next page data.
+    # when next_page is None, AsyncPagedItem will stop fetch next page data.
+    return get_next_link(feed_element), iter_entries(entry_class, convert, feed_element)
 
 
-async def extract_rule_data_template(feed_class, convert, feed_element):
+async def extract_rule_data_template(entry_class, convert, feed_element):
     """Special version of function extrat_data_template for Rule.
 
     Pass both the XML entry element and the rule instance to function `convert`. Rule needs to extract
@@ -98,18 +95,7 @@ async def extract_rule_data_template(feed_class, convert, feed_element):
     After autorest is enhanced, this method can be removed.
     Refer to autorest issue https://github.com/Azure/autorest/issues/3535
     """
-    deserialized = feed_class.deserialize(feed_element)
-    next_link = None
-    if deserialized.link and len(deserialized.link) == 2:
-        next_link = deserialized.link[1].href
-    if deserialized.entry:
-        list_of_entities = [
-            convert(*x) if convert else x for x in zip(feed_element.findall(
-                constants.ATOM_ENTRY_TAG), deserialized.entry)
-        ]
-    else:
-        list_of_entities = []
-    return next_link, iter(list_of_entities)
+    return get_next_link(feed_element), iter_rule_entries(entry_class, convert, feed_element)
 
 
 async def get_next_template(list_func, *args, start_index=0, max_page_size=100, **kwargs):
@@ -16,6 +16,7 @@ XML_SCHEMA_NAMESPACE = "http://www.w3.org/2001/XMLSchema"
 XML_SCHEMA_INSTANCE_NAMESPACE = "http://www.w3.org/2001/XMLSchema-instance"
 ATOM_ENTRY_TAG = "{http://www.w3.org/2005/Atom}entry"
 ATOM_CONTENT_TAG = "{http://www.w3.org/2005/Atom}content"
+ATOM_LINK_TAG = "{http://www.w3.org/2005/Atom}link"
 
 # ServiceBus XML namespace
 SB_XML_NAMESPACE = "http://schemas.microsoft.com/netservices/2010/10/servicebus/connect"
@@ -6,24 +6,28 @@
 # pylint:disable=specify-parameter-names-in-call
 # pylint:disable=too-many-lines
 import functools
-from typing import TYPE_CHECKING, Dict, Any, Union, cast
+import time
+from typing import TYPE_CHECKING, Dict, Any, Optional, Union, Tuple, cast
 from xml.etree.ElementTree import ElementTree
 
 from azure.core.paging import ItemPaged
 from azure.core.exceptions import ResourceNotFoundError
 from azure.core.pipeline import Pipeline
-from azure.core.pipeline.policies import HttpLoggingPolicy, DistributedTracingPolicy, ContentDecodePolicy, \
-    RequestIdPolicy, BearerTokenCredentialPolicy
+from azure.core.pipeline.policies import HttpLoggingPolicy, DistributedTracingPolicy, RequestIdPolicy, \
+    BearerTokenCredentialPolicy
 from azure.core.pipeline.transport import RequestsTransport
 
-from ._generated.models import QueueDescriptionFeed, TopicDescriptionEntry, \
-    QueueDescriptionEntry, SubscriptionDescriptionFeed, SubscriptionDescriptionEntry, RuleDescriptionEntry, \
-    RuleDescriptionFeed, NamespacePropertiesEntry, CreateTopicBody, CreateTopicBodyContent, \
-    TopicDescriptionFeed, CreateSubscriptionBody, CreateSubscriptionBodyContent, CreateRuleBody, \
+from ._generated.models import TopicDescriptionEntry, \
+    QueueDescriptionEntry, SubscriptionDescriptionEntry, RuleDescriptionEntry, \
+    NamespacePropertiesEntry, CreateTopicBody, CreateTopicBodyContent, \
+    CreateSubscriptionBody, CreateSubscriptionBodyContent, CreateRuleBody, \
     CreateRuleBodyContent, CreateQueueBody, CreateQueueBodyContent
 from ._utils import extract_data_template, get_next_template, deserialize_rule_key_values, serialize_rule_key_values, \
-    extract_rule_data_template
+    extract_rule_data_template, entry_to_queue, entry_to_queue_runtime_properties, entry_to_topic, \
+    entry_to_topic_runtime_properties, entry_to_subscription, entry_to_subscription_runtime_properties, entry_to_rule, \
+    deserialize_entry
 from ._xml_workaround_policy import ServiceBusXMLWorkaroundPolicy
+from ._xml_decode_policy import ServiceBusXMLDecodePolicy
 
 from .._common.constants import JWT_TOKEN_SCOPE
 from .._common.utils import parse_conn_str
@@ -40,6 +44,34 @@ from ._handle_response_error import _handle_response_error
 if TYPE_CHECKING:
     from azure.core.credentials import TokenCredential  # pylint:disable=ungrouped-imports
 
+# These policies keep no state between requests, so clients built without options for them share one instance of each.
+_REQUEST_ID_POLICY = RequestIdPolicy()
+_XML_DECODE_POLICY = ServiceBusXMLDecodePolicy()
+_XML_WORKAROUND_POLICY = ServiceBusXMLWorkaroundPolicy()
+_DISTRIBUTED_TRACING_POLICY = DistributedTracingPolicy()
+
+
+def _monotonic():
+    # type: () -> float
+    # Python 2.7 has no time.monotonic, so the wall clock is used there.
+    try:
+        return time.monotonic()
+    except AttributeError:
+        return time.time()
+
+# The list_* pagers share these page extractors; they hold no per-call state.
+_EXTRACT_QUEUES = functools.partial(extract_data_template, QueueDescriptionEntry, entry_to_queue)
+_EXTRACT_QUEUES_RUNTIME_PROPERTIES = functools.partial(
+    extract_data_template, QueueDescriptionEntry, entry_to_queue_runtime_properties)
+_EXTRACT_TOPICS = functools.partial(extract_data_template, TopicDescriptionEntry, entry_to_topic)
+_EXTRACT_TOPICS_RUNTIME_PROPERTIES = functools.partial(
+    extract_data_template, TopicDescriptionEntry, entry_to_topic_runtime_properties)
+_EXTRACT_SUBSCRIPTIONS = functools.partial(
+    extract_data_template, SubscriptionDescriptionEntry, entry_to_subscription)
+_EXTRACT_SUBSCRIPTIONS_RUNTIME_PROPERTIES = functools.partial(
+    extract_data_template, SubscriptionDescriptionEntry, entry_to_subscription_runtime_properties)
+_EXTRACT_RULES = functools.partial(extract_rule_data_template, RuleDescriptionEntry, entry_to_rule)
+
 
 class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
     """Use this client to create, update, list, and delete resources of a ServiceBus namespace.
@@ -47,15 +79,22 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
     :param str fully_qualified_namespace: The fully qualified host name for the Service Bus namespace.
     :param credential: To authenticate to manage the entities of the ServiceBus namespace.
     :type credential: TokenCredential
+    :keyword float entity_cache_ttl: The number of seconds for which `get_queue` and `get_topic` may return
+     properties from an earlier response instead of sending a request. By default nothing is cached.
+     Only calls made without keyword arguments are cached, and entities that were not found are never cached.
+     Changes made through this client clear the cached entity, but changes made elsewhere may be missed until
+     the cached response expires.
     """
 
     def __init__(self, fully_qualified_namespace, credential, **kwargs):
-        # type: (str, TokenCredential, Dict[str, Any]) -> None
+        # type: (str, TokenCredential, Any) -> None
         self.fully_qualified_namespace = fully_qualified_namespace
         self._credential = credential
         self._endpoint = "https://" + fully_qualified_namespace
+        self._entity_cache_ttl = kwargs.pop("entity_cache_ttl", None)  # type: Optional[float]
+        self._entity_cache = {}  # type: Dict[str, Tuple[float, ElementTree]]
         self._config = ServiceBusManagementClientConfiguration(self._endpoint, **kwargs)
-        self._pipeline = self._build_pipeline()
+        self._pipeline = self._build_pipeline(**kwargs)
         self._impl = ServiceBusManagementClientImpl(endpoint=fully_qualified_namespace, pipeline=self._pipeline)
 
     def __enter__(self):
@@ -72,18 +111,24 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
             if isinstance(self._credential, ServiceBusSharedKeyCredential) \
             else BearerTokenCredentialPolicy(self._credential, JWT_TOKEN_SCOPE)
         if policies is None:  # [] is a valid policy list
+            request_id_policy = RequestIdPolicy(**kwargs) \
+                if "request_id" in kwargs or "auto_request_id" in kwargs else _REQUEST_ID_POLICY
+            xml_decode_policy = ServiceBusXMLDecodePolicy(**kwargs) \
+                if "response_encoding" in kwargs else _XML_DECODE_POLICY
+            distributed_tracing_policy = DistributedTracingPolicy(**kwargs) \
+                if "tracing_attributes" in kwargs or "network_span_namer" in kwargs else _DISTRIBUTED_TRACING_POLICY
             policies = [
-                RequestIdPolicy(**kwargs),
+                request_id_policy,
                 self._config.headers_policy,
                 self._config.user_agent_policy,
                 self._config.proxy_policy,
-                ContentDecodePolicy(**kwargs),
-                ServiceBusXMLWorkaroundPolicy(),
+                xml_decode_policy,
+                _XML_WORKAROUND_POLICY,
                 self._config.redirect_policy,
                 self._config.retry_policy,
                 credential_policy,
                 self._config.logging_policy,
-                DistributedTracingPolicy(**kwargs),
+                distributed_tracing_policy,
                 HttpLoggingPolicy(**kwargs),
             ]
         if not transport:
@@ -100,6 +145,29 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
             )
         return element
 
+    def _get_cached_entity_element(self, entity_name, **kwargs):
+        # type: (str, Any) -> ElementTree
+        ttl = self._entity_cache_ttl
+        # Keyword arguments such as headers or timeout may change the response, so those calls bypass the cache.
+        if not ttl or kwargs:
+            return self._get_entity_element(entity_name, **kwargs)
+        now = _monotonic()
+        # The client may be shared across threads, so entries are removed with pop() in case another thread
+        # already removed them, and the cache is copied before it's scanned.
+        cached = self._entity_cache.get(entity_name)
+        if cached:
+            if cached[0] > now:
+                return cached[1]
+            self._entity_cache.pop(entity_name, None)
+        element = self._get_entity_element(entity_name)
+        # A missing entity comes back as an empty feed rather than an entry; don't cache it.
+        if element is not None and element.find(constants.ATOM_CONTENT_TAG) is not None:
+            for name, (expiry, _) in list(self._entity_cache.items()):
+                if expiry <= now:
+                    self._entity_cache.pop(name, None)
+            self._entity_cache[entity_name] = (now + ttl, element)
+        return element
+
     def _get_subscription_element(self, topic_name, subscription_name, enrich=False, **kwargs):
         # type: (str, str, bool, Any) -> ElementTree
 
@@ -135,8 +203,9 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
             credential = ServiceBusSASTokenCredential(token, token_expiry)
         elif shared_access_key_name and shared_access_key:
             credential = ServiceBusSharedKeyCredential(shared_access_key_name, shared_access_key) # type: ignore
-        if "//" in endpoint:
-            endpoint = endpoint[endpoint.index("//") + 2:]
+        left_slash_pos = endpoint.find("//")
+        if left_slash_pos != -1:
+            endpoint = endpoint[left_slash_pos + 2:]
         return cls(endpoint, credential, **kwargs)
 
     def get_queue(self, queue_name, **kwargs):
@@ -146,8 +215,8 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
         :param str queue_name: The name of the queue.
         :rtype: ~azure.servicebus.management.QueueProperties
         """
-        entry_ele = self._get_entity_element(queue_name, **kwargs)
-        entry = QueueDescriptionEntry.deserialize(entry_ele)
+        entry_ele = self._get_cached_entity_element(queue_name, **kwargs)
+        entry = deserialize_entry(QueueDescriptionEntry, entry_ele)
         if not entry.content:
             raise ResourceNotFoundError("Queue '{}' does not exist".format(queue_name))
         queue_description = QueueProperties._from_internal_entity(queue_name, entry.content.queue_description)
@@ -161,7 +230,7 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
         :rtype: ~azure.servicebus.management.QueueRuntimeProperties
         """
         entry_ele = self._get_entity_element(queue_name, **kwargs)
-        entry = QueueDescriptionEntry.deserialize(entry_ele)
+        entry = deserialize_entry(QueueDescriptionEntry, entry_ele)
         if not entry.content:
             raise ResourceNotFoundError("Queue {} does not exist".format(queue_name))
         runtime_properties = QueueRuntimeProperties._from_internal_entity(queue_name, entry.content.queue_description)
@@ -252,7 +321,8 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
                 queue_description=to_create,  # type: ignore
             )
         )
-        request_body = create_entity_body.serialize(is_xml=True)
+        # Model.serialize builds a new Serializer on every call; reuse the one the generated client holds.
+        request_body = self._impl._serialize._serialize(create_entity_body, is_xml=True)
         with _handle_response_error():
             entry_ele = cast(
                 ElementTree,
@@ -260,8 +330,9 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
                     name,  # type: ignore
                     request_body, api_version=constants.API_VERSION, **kwargs)
             )
+        self._entity_cache.pop(name, None)
 
-        entry = QueueDescriptionEntry.deserialize(entry_ele)
+        entry = deserialize_entry(QueueDescriptionEntry, entry_ele)
         result = QueueProperties._from_internal_entity(name, entry.content.queue_description)
         return result
 
@@ -289,7 +360,7 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
                 queue_description=to_update,
             )
         )
-        request_body = create_entity_body.serialize(is_xml=True)
+        request_body = self._impl._serialize._serialize(create_entity_body, is_xml=True)
         with _handle_response_error():
             self._impl.entity.put(
                 queue.name,  # type: ignore
@@ -298,6 +369,7 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
                 if_match="*",
                 **kwargs
             )
+        self._entity_cache.pop(queue.name, None)
 
     def delete_queue(self, queue, **kwargs):
         # type: (Union[str, QueueProperties], Any) -> None
@@ -317,6 +389,7 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
             self._impl.entity.delete(
                 queue_name,   # type: ignore
                 api_version=constants.API_VERSION, **kwargs)
+        self._entity_cache.pop(queue_name, None)
 
     def list_queues(self, **kwargs):
         # type: (Any) -> ItemPaged[QueueProperties]
@@ -325,19 +398,12 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
         :returns: An iterable (auto-paging) response of QueueProperties.
         :rtype: ~azure.core.paging.ItemPaged[~azure.servicebus.management.QueueProperties]
         """
-
-        def entry_to_qd(entry):
-            qd = QueueProperties._from_internal_entity(entry.title, entry.content.queue_description)
-            return qd
-
-        extract_data = functools.partial(
-            extract_data_template, QueueDescriptionFeed, entry_to_qd
-        )
         get_next = functools.partial(
-            get_next_template, functools.partial(self._impl.list_entities, constants.ENTITY_TYPE_QUEUES), **kwargs
+            get_next_template, self._impl.list_entities,
+            entity_type=constants.ENTITY_TYPE_QUEUES, **kwargs
         )
         return ItemPaged(
-            get_next, extract_data)
+            get_next, _EXTRACT_QUEUES)
 
     def list_queues_runtime_properties(self, **kwargs):
         # type: (Any) -> ItemPaged[QueueRuntimeProperties]
@@ -346,19 +412,12 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
         :returns: An iterable (auto-paging) response of QueueRuntimeProperties.
         :rtype: ~azure.core.paging.ItemPaged[~azure.servicebus.management.QueueRuntimeProperties]
         """
-
-        def entry_to_qr(entry):
-            qd = QueueRuntimeProperties._from_internal_entity(entry.title, entry.content.queue_description)
-            return qd
-
-        extract_data = functools.partial(
-            extract_data_template, QueueDescriptionFeed, entry_to_qr
-        )
         get_next = functools.partial(
-            get_next_template, functools.partial(self._impl.list_entities, constants.ENTITY_TYPE_QUEUES), **kwargs
+            get_next_template, self._impl.list_entities,
+            entity_type=constants.ENTITY_TYPE_QUEUES, **kwargs
         )
         return ItemPaged(
-            get_next, extract_data)
+            get_next, _EXTRACT_QUEUES_RUNTIME_PROPERTIES)
 
     def get_topic(self, topic_name, **kwargs):
         # type: (str, Any) -> TopicProperties
@@ -367,8 +426,8 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
         :param str topic_name: The name of the topic.
         :rtype: ~azure.servicebus.management.TopicProperties
         """
-        entry_ele = self._get_entity_element(topic_name, **kwargs)
-        entry = TopicDescriptionEntry.deserialize(entry_ele)
+        entry_ele = self._get_cached_entity_element(topic_name, **kwargs)
+        entry = deserialize_entry(TopicDescriptionEntry, entry_ele)
         if not entry.content:
             raise ResourceNotFoundError("Topic '{}' does not exist".format(topic_name))
         topic_description = TopicProperties._from_internal_entity(topic_name, entry.content.topic_description)
@@ -382,7 +441,7 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
         :rtype: ~azure.servicebus.management.TopicRuntimeProperties
         """
         entry_ele = self._get_entity_element(topic_name, **kwargs)
-        entry = TopicDescriptionEntry.deserialize(entry_ele)
+        entry = deserialize_entry(TopicDescriptionEntry, entry_ele)
         if not entry.content:
             raise ResourceNotFoundError("Topic {} does not exist".format(topic_name))
         topic_description = TopicRuntimeProperties._from_internal_entity(topic_name, entry.content.topic_description)
@@ -457,7 +516,7 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
                 topic_description=to_create,  # type: ignore
             )
         )
-        request_body = create_entity_body.serialize(is_xml=True)
+        request_body = self._impl._serialize._serialize(create_entity_body, is_xml=True)
         with _handle_response_error():
             entry_ele = cast(
                 ElementTree,
@@ -465,7 +524,8 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
                     name,  # type: ignore
                     request_body, api_version=constants.API_VERSION, **kwargs)
             )
-        entry = TopicDescriptionEntry.deserialize(entry_ele)
+        self._entity_cache.pop(name, None)
+        entry = deserialize_entry(TopicDescriptionEntry, entry_ele)
         result = TopicProperties._from_internal_entity(name, entry.content.topic_description)
         return result
 
@@ -498,7 +558,7 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
                 topic_description=to_update,
             )
         )
-        request_body = create_entity_body.serialize(is_xml=True)
+        request_body = self._impl._serialize._serialize(create_entity_body, is_xml=True)
         with _handle_response_error():
             self._impl.entity.put(
                 topic.name,  # type: ignore
@@ -507,6 +567,7 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
                 if_match="*",
                 **kwargs
             )
+        self._entity_cache.pop(topic.name, None)
 
     def delete_topic(self, topic, **kwargs):
         # type: (Union[str, TopicProperties], Any) -> None
@@ -520,6 +581,7 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
         except AttributeError:
             topic_name = topic
         self._impl.entity.delete(topic_name, api_version=constants.API_VERSION, **kwargs)
+        self._entity_cache.pop(topic_name, None)
 
     def list_topics(self, **kwargs):
         # type: (Any) -> ItemPaged[TopicProperties]
@@ -528,18 +590,12 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
         :returns: An iterable (auto-paging) response of TopicProperties.
         :rtype: ~azure.core.paging.ItemPaged[~azure.servicebus.management.TopicProperties]
         """
-        def entry_to_topic(entry):
-            topic = TopicProperties._from_internal_entity(entry.title, entry.content.topic_description)
-            return topic
-
-        extract_data = functools.partial(
-            extract_data_template, TopicDescriptionFeed, entry_to_topic
-        )
         get_next = functools.partial(
-            get_next_template, functools.partial(self._impl.list_entities, constants.ENTITY_TYPE_TOPICS), **kwargs
+            get_next_template, self._impl.list_entities,
+            entity_type=constants.ENTITY_TYPE_TOPICS, **kwargs
         )
         return ItemPaged(
-            get_next, extract_data)
+            get_next, _EXTRACT_TOPICS)
 
     def list_topics_runtime_properties(self, **kwargs):
         # type: (Any) -> ItemPaged[TopicRuntimeProperties]
@@ -548,18 +604,12 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
         :returns: An iterable (auto-paging) response of TopicRuntimeProperties.
         :rtype: ~azure.core.paging.ItemPaged[~azure.servicebus.management.TopicRuntimeProperties]
         """
-        def entry_to_topic(entry):
-            topic = TopicRuntimeProperties._from_internal_entity(entry.title, entry.content.topic_description)
-            return topic
-
-        extract_data = functools.partial(
-            extract_data_template, TopicDescriptionFeed, entry_to_topic
-        )
         get_next = functools.partial(
-            get_next_template, functools.partial(self._impl.list_entities, constants.ENTITY_TYPE_TOPICS), **kwargs
+            get_next_template, self._impl.list_entities,
+            entity_type=constants.ENTITY_TYPE_TOPICS, **kwargs
         )
         return ItemPaged(
-            get_next, extract_data)
+            get_next, _EXTRACT_TOPICS_RUNTIME_PROPERTIES)
 
     def get_subscription(self, topic, subscription_name, **kwargs):
         # type: (Union[str, TopicProperties], str, Any) -> SubscriptionProperties
@@ -574,7 +624,7 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
         except AttributeError:
             topic_name = topic
         entry_ele = self._get_subscription_element(topic_name, subscription_name, **kwargs)
-        entry = SubscriptionDescriptionEntry.deserialize(entry_ele)
+        entry = deserialize_entry(SubscriptionDescriptionEntry, entry_ele)
         if not entry.content:
             raise ResourceNotFoundError(
                 "Subscription('Topic: {}, Subscription: {}') does not exist".format(subscription_name, topic_name))
@@ -595,7 +645,7 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
         except AttributeError:
             topic_name = topic
         entry_ele = self._get_subscription_element(topic_name, subscription_name, **kwargs)
-        entry = SubscriptionDescriptionEntry.deserialize(entry_ele)
+        entry = deserialize_entry(SubscriptionDescriptionEntry, entry_ele)
         if not entry.content:
             raise ResourceNotFoundError(
                 "Subscription('Topic: {}, Subscription: {}') does not exist".format(subscription_name, topic_name))
@@ -676,7 +726,7 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
                 subscription_description=to_create,  # type: ignore
             )
         )
-        request_body = create_entity_body.serialize(is_xml=True)
+        request_body = self._impl._serialize._serialize(create_entity_body, is_xml=True)
         with _handle_response_error():
             entry_ele = cast(
                 ElementTree,
@@ -686,7 +736,7 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
                     request_body, api_version=constants.API_VERSION, **kwargs)
             )
 
-        entry = SubscriptionDescriptionEntry.deserialize(entry_ele)
+        entry = deserialize_entry(SubscriptionDescriptionEntry, entry_ele)
         result = SubscriptionProperties._from_internal_entity(
             name, entry.content.subscription_description)
         return result
@@ -718,7 +768,7 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
                 subscription_description=to_update,
             )
         )
-        request_body = create_entity_body.serialize(is_xml=True)
+        request_body = self._impl._serialize._serialize(create_entity_body, is_xml=True)
         with _handle_response_error():
             self._impl.subscription.put(
                 topic_name,
@@ -760,20 +810,11 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
             topic_name = topic.name  # type: ignore
         except AttributeError:
             topic_name = topic
-
-        def entry_to_subscription(entry):
-            subscription = SubscriptionProperties._from_internal_entity(
-                entry.title, entry.content.subscription_description)
-            return subscription
-
-        extract_data = functools.partial(
-            extract_data_template, SubscriptionDescriptionFeed, entry_to_subscription
-        )
         get_next = functools.partial(
-            get_next_template, functools.partial(self._impl.list_subscriptions, topic_name), **kwargs
+            get_next_template, self._impl.list_subscriptions, topic_name=topic_name, **kwargs
         )
         return ItemPaged(
-            get_next, extract_data)
+            get_next, _EXTRACT_SUBSCRIPTIONS)
 
     def list_subscriptions_runtime_properties(self, topic, **kwargs):
         # type: (Union[str, TopicProperties], Any) -> ItemPaged[SubscriptionRuntimeProperties]
@@ -787,20 +828,11 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
             topic_name = topic.name  # type: ignore
         except AttributeError:
             topic_name = topic
-
-        def entry_to_subscription(entry):
-            subscription = SubscriptionRuntimeProperties._from_internal_entity(
-                entry.title, entry.content.subscription_description)
-            return subscription
-
-        extract_data = functools.partial(
-            extract_data_template, SubscriptionDescriptionFeed, entry_to_subscription
-        )
         get_next = functools.partial(
-            get_next_template, functools.partial(self._impl.list_subscriptions, topic_name), **kwargs
+            get_next_template, self._impl.list_subscriptions, topic_name=topic_name, **kwargs
         )
         return ItemPaged(
-            get_next, extract_data)
+            get_next, _EXTRACT_SUBSCRIPTIONS_RUNTIME_PROPERTIES)
 
     def get_rule(self, topic, subscription, rule_name, **kwargs):
         # type: (Union[str, TopicProperties], Union[str, SubscriptionProperties], str, Any) -> RuleProperties
@@ -821,7 +853,7 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
         except AttributeError:
             subscription_name = subscription
         entry_ele = self._get_rule_element(topic_name, subscription_name, rule_name, **kwargs)
-        entry = RuleDescriptionEntry.deserialize(entry_ele)
+        entry = deserialize_entry(RuleDescriptionEntry, entry_ele)
         if not entry.content:
             raise ResourceNotFoundError(
                 "Rule('Topic: {}, Subscription: {}, Rule {}') does not exist".format(
@@ -870,7 +902,7 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
                 rule_description=to_create,  # type: ignore
             )
         )
-        request_body = create_entity_body.serialize(is_xml=True)
+        request_body = self._impl._serialize._serialize(create_entity_body, is_xml=True)
         serialize_rule_key_values(request_body, rule)
         with _handle_response_error():
             entry_ele = self._impl.rule.put(
@@ -878,7 +910,7 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
                 subscription_name,  # type: ignore
                 name,
                 request_body, api_version=constants.API_VERSION, **kwargs)
-        entry = RuleDescriptionEntry.deserialize(entry_ele)
+        entry = deserialize_entry(RuleDescriptionEntry, entry_ele)
         result = RuleProperties._from_internal_entity(name, entry.content.rule_description)
         deserialize_rule_key_values(entry_ele, result)  # to remove after #3535 is released.
         return result
@@ -914,7 +946,7 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
                 rule_description=to_update,
             )
         )
-        request_body = create_entity_body.serialize(is_xml=True)
+        request_body = self._impl._serialize._serialize(create_entity_body, is_xml=True)
         serialize_rule_key_values(request_body, rule)
         with _handle_response_error():
             self._impl.rule.put(
@@ -969,24 +1001,12 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
             subscription_name = subscription.name  # type: ignore
         except AttributeError:
             subscription_name = subscription
-
-        def entry_to_rule(ele, entry):
-            """
-            `ele` will be removed after https://github.com/Azure/autorest/issues/3535 is released.
-            """
-            rule = entry.content.rule_description
-            rule_description = RuleProperties._from_internal_entity(entry.title, rule)
-            deserialize_rule_key_values(ele, rule_description)  # to remove after #3535 is released.
-            return rule_description
-
-        extract_data = functools.partial(
-            extract_rule_data_template, RuleDescriptionFeed, entry_to_rule
-        )
         get_next = functools.partial(
-            get_next_template, functools.partial(self._impl.list_rules, topic_name, subscription_name), **kwargs
+            get_next_template, self._impl.list_rules,
+            topic_name=topic_name, subscription_name=subscription_name, **kwargs
         )
         return ItemPaged(
-            get_next, extract_data)
+            get_next, _EXTRACT_RULES)
 
     def get_namespace_properties(self, **kwargs):
         # type: (Any) -> NamespaceProperties
@@ -995,7 +1015,7 @@ class ServiceBusAdministrationClient:  # pylint:disable=too-many-public-methods
         :rtype: ~azure.servicebus.management.NamespaceProperties
         """
         entry_el = self._impl.namespace.get(api_version=constants.API_VERSION, **kwargs)
-        namespace_entry = NamespacePropertiesEntry.deserialize(entry_el)
+        namespace_entry = deserialize_entry(NamespacePropertiesEntry, entry_el)
         return NamespaceProperties._from_internal_entity(namespace_entry.title,
                                                          namespace_entry.content.namespace_properties)
 
@@ -6,7 +6,7 @@
 # pylint:disable=too-many-lines
 import functools
 from collections import OrderedDict
-from copy import deepcopy
+from copy import copy
 from datetime import datetime, timedelta
 from typing import Type, Dict, Any, Union, Optional, List
 from msrest.serialization import Model
@@ -283,7 +283,8 @@ class QueueProperties(DictMixin):  # pylint:disable=too-many-instance-attributes
             forward_dead_lettered_messages_to=internal_qd.forward_dead_lettered_messages_to,
             user_metadata=internal_qd.user_metadata
         )
-        qd._internal_qd = deepcopy(internal_qd)  # pylint:disable=protected-access
+        # _to_internal_entity reassigns fields instead of mutating them, so a shallow copy is enough.
+        qd._internal_qd = copy(internal_qd)  # pylint:disable=protected-access
         return qd
 
     def _to_internal_entity(self):
@@ -317,6 +318,8 @@ class QueueProperties(DictMixin):  # pylint:disable=too-many-instance-attributes
 class QueueRuntimeProperties(object):
     """Service Bus queue runtime properties.
     """
+    __slots__ = ("_name", "_internal_qr")
+
     def __init__(
         self,
     ):
@@ -329,7 +332,7 @@ class QueueRuntimeProperties(object):
         # type: (str, InternalQueueDescription) -> QueueRuntimeProperties
         qr = cls()
         qr._name = name
-        qr._internal_qr = deepcopy(internal_qr)  # pylint:disable=protected-access
+        qr._internal_qr = copy(internal_qr)  # pylint:disable=protected-access
         return qr
 
     @property
@@ -520,7 +523,7 @@ class TopicProperties(DictMixin):  # pylint:disable=too-many-instance-attributes
             enable_express=internal_td.enable_express,
             user_metadata=internal_td.user_metadata
         )
-        td._internal_td = deepcopy(internal_td)
+        td._internal_td = copy(internal_td)
         return td
 
     def _to_internal_entity(self):
@@ -549,6 +552,8 @@ class TopicProperties(DictMixin):  # pylint:disable=too-many-instance-attributes
 class TopicRuntimeProperties(object):
     """Runtime properties of a Service Bus topic resource.
     """
+    __slots__ = ("_name", "_internal_td")
+
     def __init__(
         self,
     ):
@@ -714,7 +719,7 @@ class SubscriptionProperties(DictMixin):  # pylint:disable=too-many-instance-att
             auto_delete_on_idle=internal_subscription.auto_delete_on_idle,
             availability_status=internal_subscription.entity_availability_status
         )
-        subscription._internal_sd = deepcopy(internal_subscription)
+        subscription._internal_sd = copy(internal_subscription)
         return subscription
 
     def _to_internal_entity(self):
@@ -743,6 +748,8 @@ class SubscriptionRuntimeProperties(object):
     """Runtime properties of a Service Bus topic subscription resource.
 
     """
+    __slots__ = ("_name", "_internal_sd")
+
     def __init__(self):
         # type: () -> None
         self._internal_sd = None  # type: Optional[InternalSubscriptionDescription]
@@ -870,7 +877,7 @@ class RuleProperties(DictMixin):
             if internal_rule.action and isinstance(internal_rule.action, tuple(RULE_CLASS_MAPPING.keys())) else None,
             created_at_utc=internal_rule.created_at
         )
-        rule._internal_rule = deepcopy(internal_rule)
+        rule._internal_rule = copy(internal_rule)
         return rule
 
     def _to_internal_entity(self):
@@ -2,11 +2,13 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License. See License.txt in the project root for license information.
 # --------------------------------------------------------------------------------------------
+# pylint:disable=protected-access
 from datetime import datetime, timedelta
 from typing import cast
 from xml.etree.ElementTree import ElementTree, SubElement, QName
 import isodate
 import six
+from msrest import Deserializer
 
 # Refer to the async version of this module under ..\aio\management\_utils.py for detailed explanation.
 
@@ -17,10 +19,46 @@ except ImportError:
 
 from azure.servicebus.management import _constants as constants
 from ._handle_response_error import _handle_response_error
+from ._generated import models
+from ._models import QueueProperties, QueueRuntimeProperties, TopicProperties, TopicRuntimeProperties, \
+    SubscriptionProperties, SubscriptionRuntimeProperties, RuleProperties
 
 
-def extract_rule_data_template(feed_class, convert, feed_element):
-    """Special version of function extrat_data_template for Rule.
+# Model.deserialize builds a new Deserializer over all the generated models on every call; the entries share this one.
+_DESERIALIZER = Deserializer({k: v for k, v in models.__dict__.items() if isinstance(v, type)})
+
+
+def deserialize_entry(entry_class, entry_element):
+    """Deserialize an ATOM <entry> XML element to an instance of the generated model `entry_class`."""
+    return _DESERIALIZER(entry_class.__name__, entry_element)
+
+
+def get_next_link(feed_element):
+    """Get the link to the next page from an ATOM feed page.
+
+    When the feed has two <link> tags, the 2nd is the next-page link.
+    """
+    links = feed_element.findall(constants.ATOM_LINK_TAG)
+    if len(links) == 2:
+        return links[1].get("href")
+    return None
+
+
+def iter_entries(entry_class, convert, feed_element):
+    """Deserialize and convert the <entry> elements of an ATOM feed page one at a time.
+
+    Each entry is only deserialized when the pager reaches it, so a page never holds the whole feed model plus
+    all the converted entities at once. The subtree of an entry is cleared once it's converted, so the parsed page
+    shrinks as the pager walks it.
+    """
+    for entry_ele in feed_element.iterfind(constants.ATOM_ENTRY_TAG):
+        entity = convert(deserialize_entry(entry_class, entry_ele))
+        entry_ele.clear()
+        yield entity
+
+
+def iter_rule_entries(entry_class, convert, feed_element):
+    """Special version of function iter_entries for Rule.
 
     Pass both the XML entry element and the rule instance to function `convert`. Rule needs to extract
     KeyValue from XML Element and set to Rule model instance manually. The autorest/msrest serialization/deserialization
@@ -28,27 +66,56 @@ def extract_rule_data_template(feed_class, convert, feed_element):
     After autorest is enhanced, this method can be removed.
     Refer to autorest issue https://github.com/Azure/autorest/issues/3535
     """
-    deserialized = feed_class.deserialize(feed_element)
-    next_link = None
-    if deserialized.link and len(deserialized.link) == 2:
-        next_link = deserialized.link[1].href
-    if deserialized.entry:
-        list_of_entities = [
-            convert(*x) if convert else x for x in zip(
-                feed_element.findall(constants.ATOM_ENTRY_TAG), deserialized.entry)
-        ]
-    else:
-        list_of_entities = []
-    return next_link, iter(list_of_entities)
-
-
-def extract_data_template(feed_class, convert, feed_element):
-    deserialized = feed_class.deserialize(feed_element)
-    list_of_entities = [convert(x) if convert else x for x in deserialized.entry]
-    next_link = None
-    if deserialized.link and len(deserialized.link) == 2:
-        next_link = deserialized.link[1].href
-    return next_link, iter(list_of_entities)
+    for entry_ele in feed_element.iterfind(constants.ATOM_ENTRY_TAG):
+        rule = convert(entry_ele, deserialize_entry(entry_class, entry_ele))
+        entry_ele.clear()
+        yield rule
+
+
+def extract_rule_data_template(entry_class, convert, feed_element):
+    """Special version of function extrat_data_template for Rule.
+
+    Refer to function `iter_rule_entries` for why rule entries need their XML element.
+    """
+    return get_next_link(feed_element), iter_rule_entries(entry_class, convert, feed_element)
+
+
+def extract_data_template(entry_class, convert, feed_element):
+    return get_next_link(feed_element), iter_entries(entry_class, convert, feed_element)
+
+
+def entry_to_queue(entry):
+    return QueueProperties._from_internal_entity(entry.title, entry.content.queue_description)
+
+
+def entry_to_queue_runtime_properties(entry):
+    return QueueRuntimeProperties._from_internal_entity(entry.title, entry.content.queue_description)
+
+
+def entry_to_topic(entry):
+    return TopicProperties._from_internal_entity(entry.title, entry.content.topic_description)
+
+
+def entry_to_topic_runtime_properties(entry):
+    return TopicRuntimeProperties._from_internal_entity(entry.title, entry.content.topic_description)
+
+
+def entry_to_subscription(entry):
+    return SubscriptionProperties._from_internal_entity(entry.title, entry.content.subscription_description)
+
+
+def entry_to_subscription_runtime_properties(entry):
+    return SubscriptionRuntimeProperties._from_internal_entity(entry.title, entry.content.subscription_description)
+
+
+def entry_to_rule(ele, entry):
+    """
+    `ele` will be removed after https://github.com/Azure/autorest/issues/3535 is released.
+    """
+    rule = entry.content.rule_description
+    rule_description = RuleProperties._from_internal_entity(entry.title, rule)
+    deserialize_rule_key_values(ele, rule_description)  # to remove after #3535 is released.
+    return rule_description
 
 
 def get_next_template(list_func, *args, **kwargs):
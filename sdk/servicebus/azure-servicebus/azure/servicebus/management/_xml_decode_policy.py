@@ -0,0 +1,36 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+import xml.etree.ElementTree as ET
+
+from azure.core.pipeline.policies import ContentDecodePolicy
+
+
+class ServiceBusXMLDecodePolicy(ContentDecodePolicy):
+    """A ContentDecodePolicy that parses the XML responses of ServiceBus management from bytes.
+
+    ContentDecodePolicy decodes the response body to text and ElementTree encodes that text again before parsing
+    it. This policy hands the body bytes to ElementTree directly. Anything that isn't XML is left to
+    ContentDecodePolicy.
+
+    The parser stays xml.etree.ElementTree because msrest only deserializes instances of its Element class.
+    """
+    @classmethod
+    def deserialize_from_http_generics(cls, response, encoding=None):
+        """Deserialize from HTTP response.
+
+        :param response: The HTTP response
+        :param encoding: The encoding to use if known for this service (will disable auto-detection)
+        :raises ~azure.core.exceptions.DecodeError: If deserialization fails
+        :returns: A XML tree, or what ContentDecodePolicy returns if the response is not XML
+        """
+        if not encoding and response.content_type and "xml" in response.content_type.split(";")[0].lower():
+            body = response.body()
+            if not body:
+                return None
+            try:
+                return ET.fromstring(body)  # nosec
+            except ET.ParseError:
+                pass  # ContentDecodePolicy tries JSON before it raises DecodeError
+        return super(ServiceBusXMLDecodePolicy, cls).deserialize_from_http_generics(response, encoding)
@@ -30,10 +30,11 @@ class ServiceBusXMLWorkaroundPolicy(SansIOHTTPPolicy):
         :type request: ~azure.core.pipeline.PipelineRequest
         """
         request_body = request.http_request.body
-        if request_body:
-            if b'<ns1:' in request_body:
-                request_body = request_body.replace(b'ns1:', b'')
-                request_body = request_body.replace(b':ns1', b'')
+        # The body is already the UTF-8 bytes set by HttpRequest.set_xml_body, so it's only rewritten when
+        # the prefix has to be removed.
+        if request_body and b'<ns1:' in request_body:
+            request_body = request_body.replace(b'ns1:', b'')
+            request_body = request_body.replace(b':ns1', b'')
             request.http_request.body = request_body
             request.http_request.data = request_body
             request.http_request.headers["Content-Length"] = str(len(request_body))
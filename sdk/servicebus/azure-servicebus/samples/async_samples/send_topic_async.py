@@ -48,8 +48,12 @@ async def main():
     async with servicebus_client:
         sender = servicebus_client.get_topic_sender(topic_name=TOPIC_NAME)
         async with sender:
-            await send_single_message(sender)
-            await send_batch_message(sender)
+            # The two sends run concurrently on the same sender, so the single message and the batch
+            # may reach the topic in either order. Await them one after another if the order matters.
+            await asyncio.gather(
+                send_single_message(sender),
+                send_batch_message(sender)
+            )
 
     print("Send message is done.")
 
@@ -6,6 +6,11 @@
 import pytest
 
 from azure.core.exceptions import HttpResponseError
+from azure.core.pipeline.transport import AsyncHttpTransport, AsyncHttpResponse
+
+ATOM_CONTENT_TYPE = "application/atom+xml;type=entry;charset=utf-8"
+SB_XML_NAMESPACES = 'xmlns="http://schemas.microsoft.com/netservices/2010/10/servicebus/connect" ' \
+                    'xmlns:i="http://www.w3.org/2001/XMLSchema-instance"'
 
 
 class AsyncMgmtListTestHelperInterface(object):
@@ -146,3 +151,58 @@ async def clear_topics(servicebus_management_client):
             await servicebus_management_client.delete_topic(topic)
         except:
             pass
+
+
+def atom_entry(name, description):
+    return '<entry xmlns="http://www.w3.org/2005/Atom"><title type="text">{}</title>' \
+           '<content type="application/xml">{}</content></entry>'.format(name, description)
+
+
+def queue_entry(name, max_delivery_count=10):
+    return atom_entry(name, '<QueueDescription {}><MaxDeliveryCount>{}</MaxDeliveryCount>'
+                            '</QueueDescription>'.format(SB_XML_NAMESPACES, max_delivery_count))
+
+
+def topic_entry(name, max_size_in_megabytes=1024):
+    return atom_entry(name, '<TopicDescription {}><MaxSizeInMegabytes>{}</MaxSizeInMegabytes>'
+                            '</TopicDescription>'.format(SB_XML_NAMESPACES, max_size_in_megabytes))
+
+
+def atom_feed(entries):
+    return '<feed xmlns="http://www.w3.org/2005/Atom"><title type="text">Feed</title>{}</feed>'.format(
+        "".join(entries))
+
+
+class AsyncMockResponse(AsyncHttpResponse):
+    def __init__(self, request, body, status_code=200, content_type=ATOM_CONTENT_TYPE):
+        super(AsyncMockResponse, self).__init__(request, None)
+        self.status_code = status_code
+        self.content_type = content_type
+        self.headers = {"Content-Type": content_type}
+        self._body = body.encode("utf-8")
+
+    def body(self):
+        return self._body
+
+
+class AsyncMockTransport(AsyncHttpTransport):
+    """Answers each request with the body returned by `respond(request)` and records the requests."""
+    def __init__(self, respond):
+        self.respond = respond
+        self.requests = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def send(self, request, **kwargs):
+        self.requests.append(request)
+        return AsyncMockResponse(request, self.respond(request))
@@ -0,0 +1,143 @@
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import time
+
+import pytest
+
+from azure.core.exceptions import ResourceNotFoundError
+from azure.servicebus.aio.management import ServiceBusAdministrationClient
+from azure.servicebus.aio._base_handler_async import ServiceBusSharedKeyCredential
+
+from mgmt_test_utilities_async import AsyncMockTransport, queue_entry, topic_entry, atom_feed
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+def respond_with_entity(request):
+    if request.method == "DELETE":
+        return ""
+    name = request.url.split("?")[0].rsplit("/", 1)[1]
+    return topic_entry(name) if name.startswith("topic") else queue_entry(name)
+
+
+def get_requests(transport):
+    return [r for r in transport.requests if r.method == "GET"]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake_clock = FakeClock()
+    monkeypatch.setattr(time, "monotonic", fake_clock.monotonic, raising=False)
+    return fake_clock
+
+
+def create_client(respond=respond_with_entity, **kwargs):
+    transport = AsyncMockTransport(respond)
+    client = ServiceBusAdministrationClient(
+        "fake.servicebus.windows.net", ServiceBusSharedKeyCredential("name", "key"), transport=transport, **kwargs)
+    return client, transport
+
+
+@pytest.mark.asyncio
+async def test_async_mgmt_entity_cache_disabled_by_default(clock):
+    client, transport = create_client()
+    await client.get_queue("queue1")
+    await client.get_queue("queue1")
+    await client.get_topic("topic1")
+    await client.get_topic("topic1")
+    assert len(get_requests(transport)) == 4
+    assert not client._entity_cache
+
+
+@pytest.mark.asyncio
+async def test_async_mgmt_entity_cache_hit_within_ttl(clock):
+    client, transport = create_client(entity_cache_ttl=30)
+    assert (await client.get_queue("queue1")).max_delivery_count == 10
+    clock.now += 29
+    assert (await client.get_queue("queue1")).max_delivery_count == 10
+    assert (await client.get_topic("topic1")).max_size_in_megabytes == 1024
+    assert (await client.get_topic("topic1")).max_size_in_megabytes == 1024
+    assert len(get_requests(transport)) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_mgmt_entity_cache_refetch_after_ttl(clock):
+    client, transport = create_client(entity_cache_ttl=30)
+    await client.get_queue("queue1")
+    clock.now += 30
+    await client.get_queue("queue1")
+    assert len(get_requests(transport)) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_mgmt_entity_cache_evicts_expired_entries(clock):
+    client, transport = create_client(entity_cache_ttl=30)
+    await client.get_queue("queue1")
+    clock.now += 30
+    await client.get_queue("queue2")
+    assert list(client._entity_cache) == ["queue2"]
+
+
+@pytest.mark.asyncio
+async def test_async_mgmt_entity_cache_skips_calls_with_kwargs(clock):
+    client, transport = create_client(entity_cache_ttl=30)
+    await client.get_queue("queue1")
+    await client.get_queue("queue1", headers={"x-ms-test": "1"})
+    await client.get_queue("queue1", timeout=5)
+    assert len(get_requests(transport)) == 3
+    assert get_requests(transport)[1].headers["x-ms-test"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_async_mgmt_entity_cache_does_not_cache_not_found(clock):
+    client, transport = create_client(lambda request: atom_feed([]), entity_cache_ttl=30)
+    with pytest.raises(ResourceNotFoundError):
+        await client.get_queue("queue1")
+    with pytest.raises(ResourceNotFoundError):
+        await client.get_queue("queue1")
+    assert len(get_requests(transport)) == 2
+    assert not client._entity_cache
+
+
+async def get_queue(client, name):
+    return await client.get_queue(name)
+
+
+async def get_topic(client, name):
+    return await client.get_topic(name)
+
+
+async def update_queue(client, name):
+    await client.update_queue(await client.get_queue(name))
+
+
+async def update_topic(client, name):
+    await client.update_topic(await client.get_topic(name))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name, get_entity, change_entity", [
+    ("queue1", get_queue, lambda client, name: client.create_queue(name)),
+    ("queue1", get_queue, update_queue),
+    ("queue1", get_queue, lambda client, name: client.delete_queue(name)),
+    ("topic1", get_topic, lambda client, name: client.create_topic(name)),
+    ("topic1", get_topic, update_topic),
+    ("topic1", get_topic, lambda client, name: client.delete_topic(name)),
+], ids=["create_queue", "update_queue", "delete_queue", "create_topic", "update_topic", "delete_topic"])
+async def test_async_mgmt_entity_cache_invalidated_by_changes(clock, name, get_entity, change_entity):
+    client, transport = create_client(entity_cache_ttl=30)
+    await get_entity(client, name)
+    await change_entity(client, name)
+    assert name not in client._entity_cache
+    gets_before = len(get_requests(transport))
+    await get_entity(client, name)
+    assert len(get_requests(transport)) == gets_before + 1
@@ -0,0 +1,54 @@
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import pytest
+
+from azure.core.pipeline.policies import RequestIdPolicy, DistributedTracingPolicy
+from azure.servicebus.aio.management import ServiceBusAdministrationClient
+from azure.servicebus.aio.management import _management_client_async
+from azure.servicebus.management._xml_decode_policy import ServiceBusXMLDecodePolicy
+from azure.servicebus.aio._base_handler_async import ServiceBusSharedKeyCredential
+
+from mgmt_test_utilities_async import AsyncMockTransport, queue_entry
+
+
+def create_client(**kwargs):
+    transport = AsyncMockTransport(lambda request: queue_entry("queue1"))
+    client = ServiceBusAdministrationClient(
+        "fake.servicebus.windows.net", ServiceBusSharedKeyCredential("name", "key"), transport=transport, **kwargs)
+    return client, transport
+
+
+def pipeline_policy(client, policy_type):
+    for policy in client._pipeline._impl_policies:
+        policy = getattr(policy, "_policy", policy)
+        if isinstance(policy, policy_type):
+            return policy
+    return None
+
+
+@pytest.mark.asyncio
+async def test_async_mgmt_pipeline_uses_passed_transport():
+    client, transport = create_client()
+    await client.get_queue("queue1")
+    assert len(transport.requests) == 1
+    assert transport.requests[0].url.startswith("https://fake.servicebus.windows.net/queue1")
+
+
+def test_async_mgmt_pipeline_shares_default_policies():
+    client, _ = create_client()
+    assert pipeline_policy(client, RequestIdPolicy) is _management_client_async._REQUEST_ID_POLICY
+    assert pipeline_policy(client, ServiceBusXMLDecodePolicy) is _management_client_async._XML_DECODE_POLICY
+    assert pipeline_policy(client, DistributedTracingPolicy) is _management_client_async._DISTRIBUTED_TRACING_POLICY
+
+
+@pytest.mark.asyncio
+async def test_async_mgmt_pipeline_honours_policy_options():
+    client, transport = create_client(
+        request_id="fixed-request-id", response_encoding="utf-8", tracing_attributes={"namespace": "test"})
+    await client.get_queue("queue1")
+    assert transport.requests[0].headers["x-ms-client-request-id"] == "fixed-request-id"
+    assert pipeline_policy(client, ServiceBusXMLDecodePolicy)._response_encoding == "utf-8"
+    assert pipeline_policy(client, DistributedTracingPolicy)._tracing_attributes == {"namespace": "test"}
@@ -0,0 +1,50 @@
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from azure.servicebus.management._generated.models import QueueDescriptionEntry
+from azure.servicebus.management._utils import entry_to_queue
+from azure.servicebus.aio.management._utils import extract_data_template, get_next_template
+
+from mgmt_test_utilities_async import atom_feed, queue_entry
+
+NEXT_LINK = "https://sb.example/$Resources/queues?%24skip=2&%24top=2&api-version=2017-04"
+
+
+def parse(xml):
+    return ET.fromstring(xml.encode("utf-8"))
+
+
+@pytest.mark.asyncio
+async def test_async_mgmt_utils_extract_data_template():
+    feed = parse(atom_feed([queue_entry("queue1"), queue_entry("queue2")]))
+    next_link, queues = await extract_data_template(QueueDescriptionEntry, entry_to_queue, feed)
+    assert next_link is None
+    assert [q.name for q in queues] == ["queue1", "queue2"]
+
+
+@pytest.mark.asyncio
+async def test_async_mgmt_utils_empty_feed():
+    next_link, queues = await extract_data_template(QueueDescriptionEntry, entry_to_queue, parse(atom_feed([])))
+    assert next_link is None
+    assert list(queues) == []
+
+
+@pytest.mark.asyncio
+async def test_async_mgmt_utils_get_next_template_reads_next_link():
+    calls = []
+
+    async def list_func(**kwargs):
+        calls.append(kwargs)
+        return parse(atom_feed([]))
+
+    await get_next_template(list_func, None, start_index=4, max_page_size=7)
+    await get_next_template(list_func, NEXT_LINK)
+    assert calls[0]["skip"] == 4 and calls[0]["top"] == 7
+    assert calls[1]["skip"] == 2 and calls[1]["top"] == 2
+    assert calls[1]["api_version"] == "2017-04"
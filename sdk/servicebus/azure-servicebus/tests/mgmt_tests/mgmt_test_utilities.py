@@ -6,6 +6,11 @@
 import pytest
 
 from azure.core.exceptions import HttpResponseError
+from azure.core.pipeline.transport import HttpTransport, HttpResponse
+
+ATOM_CONTENT_TYPE = "application/atom+xml;type=entry;charset=utf-8"
+SB_XML_NAMESPACES = 'xmlns="http://schemas.microsoft.com/netservices/2010/10/servicebus/connect" ' \
+                    'xmlns:i="http://www.w3.org/2001/XMLSchema-instance"'
 
 
 class MgmtListTestHelperInterface(object):
@@ -139,3 +144,67 @@ def clear_topics(servicebus_management_client):
             servicebus_management_client.delete_topic(topic)
         except:
             pass
+
+
+def atom_entry(name, description):
+    return '<entry xmlns="http://www.w3.org/2005/Atom"><title type="text">{}</title>' \
+           '<content type="application/xml">{}</content></entry>'.format(name, description)
+
+
+def queue_entry(name, max_delivery_count=10):
+    return atom_entry(name, '<QueueDescription {}><MaxDeliveryCount>{}</MaxDeliveryCount>'
+                            '</QueueDescription>'.format(SB_XML_NAMESPACES, max_delivery_count))
+
+
+def topic_entry(name, max_size_in_megabytes=1024):
+    return atom_entry(name, '<TopicDescription {}><MaxSizeInMegabytes>{}</MaxSizeInMegabytes>'
+                            '</TopicDescription>'.format(SB_XML_NAMESPACES, max_size_in_megabytes))
+
+
+def rule_entry(name, sql_expression="1=1"):
+    return atom_entry(name, '<RuleDescription {}><Filter i:type="SqlFilter"><SqlExpression>{}</SqlExpression>'
+                            '</Filter><Action i:type="EmptyRuleAction"/><Name>{}</Name>'
+                            '</RuleDescription>'.format(SB_XML_NAMESPACES, sql_expression, name))
+
+
+def atom_feed(entries, next_link=None):
+    links = '<link rel="self" href="https://sb.example/$Resources/queues?$skip=0&amp;$top=100&amp;api-version=2017-04"/>'
+    if next_link:
+        links += '<link rel="next" href="{}"/>'.format(next_link.replace("&", "&amp;"))
+    return '<feed xmlns="http://www.w3.org/2005/Atom"><title type="text">Feed</title>{}{}</feed>'.format(
+        links, "".join(entries))
+
+
+class MockResponse(HttpResponse):
+    def __init__(self, request, body, status_code=200, content_type=ATOM_CONTENT_TYPE):
+        super(MockResponse, self).__init__(request, None)
+        self.status_code = status_code
+        self.content_type = content_type
+        self.headers = {"Content-Type": content_type}
+        self._body = body.encode("utf-8") if not isinstance(body, bytes) else body
+
+    def body(self):
+        return self._body
+
+
+class MockTransport(HttpTransport):
+    """Answers each request with the body returned by `respond(request)` and records the requests."""
+    def __init__(self, respond):
+        self.respond = respond
+        self.requests = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        return MockResponse(request, self.respond(request))
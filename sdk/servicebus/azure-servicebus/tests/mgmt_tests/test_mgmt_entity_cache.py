@@ -0,0 +1,145 @@
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import time
+
+import pytest
+
+from azure.core.exceptions import ResourceNotFoundError
+from azure.servicebus.management import ServiceBusAdministrationClient
+from azure.servicebus._base_handler import ServiceBusSharedKeyCredential
+
+from mgmt_test_utilities import MockTransport, queue_entry, topic_entry, atom_feed
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+def respond_with_entity(request):
+    if request.method == "DELETE":
+        return ""
+    name = request.url.split("?")[0].rsplit("/", 1)[1]
+    return topic_entry(name) if name.startswith("topic") else queue_entry(name)
+
+
+def get_requests(transport):
+    return [r for r in transport.requests if r.method == "GET"]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake_clock = FakeClock()
+    monkeypatch.setattr(time, "monotonic", fake_clock.monotonic, raising=False)
+    return fake_clock
+
+
+def create_client(respond=respond_with_entity, **kwargs):
+    transport = MockTransport(respond)
+    client = ServiceBusAdministrationClient(
+        "fake.servicebus.windows.net", ServiceBusSharedKeyCredential("name", "key"), transport=transport, **kwargs)
+    return client, transport
+
+
+def test_mgmt_entity_cache_disabled_by_default(clock):
+    client, transport = create_client()
+    client.get_queue("queue1")
+    client.get_queue("queue1")
+    client.get_topic("topic1")
+    client.get_topic("topic1")
+    assert len(get_requests(transport)) == 4
+    assert not client._entity_cache
+
+
+def test_mgmt_entity_cache_hit_within_ttl(clock):
+    client, transport = create_client(entity_cache_ttl=30)
+    assert client.get_queue("queue1").max_delivery_count == 10
+    clock.now += 29
+    assert client.get_queue("queue1").max_delivery_count == 10
+    assert client.get_topic("topic1").max_size_in_megabytes == 1024
+    assert client.get_topic("topic1").max_size_in_megabytes == 1024
+    assert len(get_requests(transport)) == 2
+
+
+def test_mgmt_entity_cache_refetch_after_ttl(clock):
+    client, transport = create_client(entity_cache_ttl=30)
+    client.get_queue("queue1")
+    clock.now += 30
+    client.get_queue("queue1")
+    assert len(get_requests(transport)) == 2
+
+
+def test_mgmt_entity_cache_evicts_expired_entries(clock):
+    client, transport = create_client(entity_cache_ttl=30)
+    client.get_queue("queue1")
+    clock.now += 30
+    client.get_queue("queue2")
+    assert list(client._entity_cache) == ["queue2"]
+
+
+class RacingCache(dict):
+    """Removes an entry right after it's read, as another thread sharing the client could."""
+    def get(self, key, default=None):
+        value = super(RacingCache, self).get(key, default)
+        self.pop(key, None)
+        return value
+
+
+def test_mgmt_entity_cache_tolerates_concurrent_removal(clock):
+    client, transport = create_client(entity_cache_ttl=30)
+    client._entity_cache = RacingCache()
+    client.get_queue("queue1")
+    clock.now += 30
+    client.get_queue("queue1")
+    assert len(get_requests(transport)) == 2
+
+
+def test_mgmt_entity_cache_skips_calls_with_kwargs(clock):
+    client, transport = create_client(entity_cache_ttl=30)
+    client.get_queue("queue1")
+    client.get_queue("queue1", headers={"x-ms-test": "1"})
+    client.get_queue("queue1", timeout=5)
+    assert len(get_requests(transport)) == 3
+    assert get_requests(transport)[1].headers["x-ms-test"] == "1"
+
+
+def test_mgmt_entity_cache_does_not_cache_not_found(clock):
+    client, transport = create_client(lambda request: atom_feed([]), entity_cache_ttl=30)
+    with pytest.raises(ResourceNotFoundError):
+        client.get_queue("queue1")
+    with pytest.raises(ResourceNotFoundError):
+        client.get_queue("queue1")
+    assert len(get_requests(transport)) == 2
+    assert not client._entity_cache
+
+
+def get_queue(client, name):
+    return client.get_queue(name)
+
+
+def get_topic(client, name):
+    return client.get_topic(name)
+
+
+@pytest.mark.parametrize("name, get_entity, change_entity", [
+    ("queue1", get_queue, lambda client, name: client.create_queue(name)),
+    ("queue1", get_queue, lambda client, name: client.update_queue(client.get_queue(name))),
+    ("queue1", get_queue, lambda client, name: client.delete_queue(name)),
+    ("topic1", get_topic, lambda client, name: client.create_topic(name)),
+    ("topic1", get_topic, lambda client, name: client.update_topic(client.get_topic(name))),
+    ("topic1", get_topic, lambda client, name: client.delete_topic(name)),
+], ids=["create_queue", "update_queue", "delete_queue", "create_topic", "update_topic", "delete_topic"])
+def test_mgmt_entity_cache_invalidated_by_changes(clock, name, get_entity, change_entity):
+    client, transport = create_client(entity_cache_ttl=30)
+    get_entity(client, name)
+    change_entity(client, name)
+    assert name not in client._entity_cache
+    gets_before = len(get_requests(transport))
+    get_entity(client, name)
+    assert len(get_requests(transport)) == gets_before + 1
@@ -0,0 +1,121 @@
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import xml.etree.ElementTree as ET
+
+from azure.servicebus.management import SqlRuleFilter, TrueRuleFilter
+from azure.servicebus.management._generated.models import QueueDescriptionEntry, RuleDescriptionEntry
+from azure.servicebus.management._utils import get_next_link, iter_entries, iter_rule_entries, \
+    extract_data_template, extract_rule_data_template, get_next_template, entry_to_queue, entry_to_rule
+
+from mgmt_test_utilities import SB_XML_NAMESPACES, atom_entry, atom_feed, queue_entry, rule_entry
+
+NEXT_LINK = "https://sb.example/$Resources/queues?%24skip=2&%24top=2&api-version=2017-04"
+
+
+def parse(xml):
+    return ET.fromstring(xml.encode("utf-8"))
+
+
+def test_mgmt_utils_single_page_has_no_next_link():
+    feed = parse(atom_feed([queue_entry("queue1", max_delivery_count=3), queue_entry("queue2")]))
+    next_link, queues = extract_data_template(QueueDescriptionEntry, entry_to_queue, feed)
+    assert next_link is None
+    queues = list(queues)
+    assert [q.name for q in queues] == ["queue1", "queue2"]
+    assert [q.max_delivery_count for q in queues] == [3, 10]
+
+
+def test_mgmt_utils_next_link_follows_self_link():
+    feed = parse(atom_feed([queue_entry("queue1"), queue_entry("queue2")], next_link=NEXT_LINK))
+    assert get_next_link(feed) == NEXT_LINK
+    next_link, queues = extract_data_template(QueueDescriptionEntry, entry_to_queue, feed)
+    assert next_link == NEXT_LINK
+    assert [q.name for q in queues] == ["queue1", "queue2"]
+
+
+def test_mgmt_utils_empty_feed():
+    feed = parse(atom_feed([]))
+    next_link, queues = extract_data_template(QueueDescriptionEntry, entry_to_queue, feed)
+    assert next_link is None
+    assert list(queues) == []
+
+
+def test_mgmt_utils_entries_are_converted_lazily():
+    feed = parse(atom_feed([queue_entry("queue1"), queue_entry("queue2")]))
+    converted = []
+
+    def convert(entry):
+        converted.append(entry.title)
+        return entry_to_queue(entry)
+
+    queues = iter_entries(QueueDescriptionEntry, convert, feed)
+    assert converted == []
+    assert next(queues).name == "queue1"
+    assert converted == ["queue1"]
+    assert next(queues).name == "queue2"
+    assert converted == ["queue1", "queue2"]
+
+
+def test_mgmt_utils_rule_entries():
+    sql_rule = atom_entry(
+        "rule1",
+        '<RuleDescription {}><Filter i:type="SqlFilter"><SqlExpression>priority = @p</SqlExpression>'
+        '<Parameters><KeyValueOfstringanyType><Key>@p</Key>'
+        '<Value xmlns:d6p1="http://www.w3.org/2001/XMLSchema" i:type="d6p1:int">5</Value>'
+        '</KeyValueOfstringanyType></Parameters><CompatibilityLevel>20</CompatibilityLevel></Filter>'
+        '<Action i:type="EmptyRuleAction"/><Name>rule1</Name></RuleDescription>'.format(SB_XML_NAMESPACES))
+    true_rule = atom_entry(
+        "rule2",
+        '<RuleDescription {}><Filter i:type="TrueFilter"><SqlExpression>1=1</SqlExpression></Filter>'
+        '<Action i:type="EmptyRuleAction"/><Name>rule2</Name></RuleDescription>'.format(SB_XML_NAMESPACES))
+    feed = parse(atom_feed([sql_rule, true_rule]))
+    next_link, rules = extract_rule_data_template(RuleDescriptionEntry, entry_to_rule, feed)
+    assert next_link is None
+    rules = list(rules)
+    assert [r.name for r in rules] == ["rule1", "rule2"]
+    assert isinstance(rules[0].filter, SqlRuleFilter)
+    assert rules[0].filter.sql_expression == "priority = @p"
+    assert rules[0].filter.parameters == {"@p": 5}
+    assert isinstance(rules[1].filter, TrueRuleFilter)
+
+
+def test_mgmt_utils_rule_entries_without_parameters():
+    feed = parse(atom_feed([rule_entry("rule1", "a = 1")]))
+    rules = list(iter_rule_entries(RuleDescriptionEntry, entry_to_rule, feed))
+    assert rules[0].filter.sql_expression == "a = 1"
+    assert not rules[0].filter.parameters
+
+
+def test_mgmt_utils_get_next_template_reads_next_link():
+    calls = []
+
+    def list_func(**kwargs):
+        calls.append(kwargs)
+        return parse(atom_feed([]))
+
+    get_next_template(list_func, None, start_index=4, max_page_size=7)
+    get_next_template(list_func, NEXT_LINK)
+    assert calls[0]["skip"] == 4 and calls[0]["top"] == 7
+    assert calls[1]["skip"] == 2 and calls[1]["top"] == 2
+    assert calls[1]["api_version"] == "2017-04"
+
+
+def test_mgmt_utils_converted_entries_are_cleared():
+    feed = parse(atom_feed([queue_entry("queue1"), queue_entry("queue2")]))
+    entries = feed.findall("{http://www.w3.org/2005/Atom}entry")
+    queues = iter_entries(QueueDescriptionEntry, entry_to_queue, feed)
+    assert next(queues).name == "queue1"
+    assert len(entries[0]) == 0
+    assert len(entries[1]) > 0
+    assert next(queues).name == "queue2"
+    assert len(entries[1]) == 0
+
+
+def test_mgmt_utils_converted_rule_entries_are_cleared():
+    feed = parse(atom_feed([rule_entry("rule1")]))
+    entries = feed.findall("{http://www.w3.org/2005/Atom}entry")
+    assert [r.name for r in iter_rule_entries(RuleDescriptionEntry, entry_to_rule, feed)] == ["rule1"]
+    assert len(entries[0]) == 0
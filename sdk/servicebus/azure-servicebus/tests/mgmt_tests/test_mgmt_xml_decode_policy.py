@@ -0,0 +1,51 @@
+#-------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+#--------------------------------------------------------------------------
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from azure.core.exceptions import DecodeError
+from azure.core.pipeline.transport import HttpRequest
+from azure.servicebus.management._xml_decode_policy import ServiceBusXMLDecodePolicy
+
+from mgmt_test_utilities import MockResponse, queue_entry
+
+
+def decode(body, content_type="application/atom+xml;type=entry;charset=utf-8", encoding=None):
+    response = MockResponse(HttpRequest("GET", "https://sb.example/queue1"), body, content_type=content_type)
+    return ServiceBusXMLDecodePolicy.deserialize_from_http_generics(response, encoding)
+
+
+def test_mgmt_xml_decode_policy_parses_xml_bytes():
+    element = decode(queue_entry("queue1").encode("utf-8"))
+    assert isinstance(element, ET.Element)
+    assert element.tag == "{http://www.w3.org/2005/Atom}entry"
+    assert element.find("{http://www.w3.org/2005/Atom}title").text == "queue1"
+
+
+def test_mgmt_xml_decode_policy_parses_non_ascii_xml():
+    element = decode(u'<?xml version="1.0" encoding="utf-8"?><title>caf\xe9</title>'.encode("utf-8"))
+    assert element.text == u"caf\xe9"
+
+
+def test_mgmt_xml_decode_policy_falls_back_for_other_content_types():
+    assert decode(b'{"name": "queue1"}', content_type="application/json") == {"name": "queue1"}
+    assert decode(b"queue1", content_type="text/plain") == "queue1"
+
+
+def test_mgmt_xml_decode_policy_falls_back_when_encoding_is_given():
+    element = decode(queue_entry("queue1").encode("utf-8"), encoding="utf-8")
+    assert element.find("{http://www.w3.org/2005/Atom}title").text == "queue1"
+
+
+def test_mgmt_xml_decode_policy_empty_body():
+    assert decode(b"") is None
+
+
+def test_mgmt_xml_decode_policy_malformed_body():
+    with pytest.raises(DecodeError) as error:
+        decode(b"<entry><title>queue1</entry>")
+    assert isinstance(error.value.exc_value, ET.ParseError)
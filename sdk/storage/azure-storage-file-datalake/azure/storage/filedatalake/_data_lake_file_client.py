@@ -636,16 +636,15 @@ class DataLakeFileClient(PathClient):
                 :caption: Rename the source file.
         """
         new_name = new_name.strip('/')
-        new_file_system = new_name.split('/')[0]
+        new_file_system = new_name.partition('/')[0]
         new_path_and_token = new_name[len(new_file_system):].split('?')
         new_path = new_path_and_token[0]
-        try:
+        if len(new_path_and_token) > 1:
             new_file_sas = new_path_and_token[1] or self._query_str.strip('?')
-        except IndexError:
-            if not self._raw_credential and new_file_system != self.file_system_name:
+        elif not self._raw_credential:
+            if new_file_system != self.file_system_name:
                 raise ValueError("please provide the sas token for the new file")
-            if not self._raw_credential and new_file_system == self.file_system_name:
-                new_file_sas = self._query_str.strip('?')
+            new_file_sas = self._query_str.strip('?')
 
         new_file_client = DataLakeFileClient(
             "{}://{}".format(self.scheme, self.primary_hostname), new_file_system, file_path=new_path,
@@ -4,8 +4,6 @@
 # license information.
 # --------------------------------------------------------------------------
 
-import uuid
-
 from typing import (  # pylint: disable=unused-import
     Union, Optional, Any,
     TypeVar, TYPE_CHECKING
@@ -47,19 +45,42 @@ class DataLakeLeaseClient(object):
             self, client, lease_id=None
     ):  # pylint: disable=missing-client-constructor-parameter-credential,missing-client-constructor-parameter-kwargs
         # type: (Union[FileSystemClient, DataLakeDirectoryClient, DataLakeFileClient], Optional[str]) -> None
-        self.id = lease_id or str(uuid.uuid4())
-        self.last_modified = None
-        self.etag = None
-
-        if hasattr(client, '_blob_client'):
-            _client = client._blob_client  # type: ignore # pylint: disable=protected-access
-        elif hasattr(client, '_container_client'):
-            _client = client._container_client  # type: ignore # pylint: disable=protected-access
-        else:
+        _client = getattr(client, '_blob_client', None) or getattr(client, '_container_client', None)
+        if _client is None:
             raise TypeError("Lease must use any of FileSystemClient DataLakeDirectoryClient, or DataLakeFileClient.")
 
         self._blob_lease_client = BlobLeaseClient(_client, lease_id=lease_id)
 
+    @property
+    def id(self):
+        # type: () -> str
+        return self._blob_lease_client.id
+
+    @id.setter
+    def id(self, value):
+        # type: (str) -> None
+        self._blob_lease_client.id = value
+
+    @property
+    def etag(self):
+        # type: () -> Optional[str]
+        return self._blob_lease_client.etag
+
+    @etag.setter
+    def etag(self, value):
+        # type: (Optional[str]) -> None
+        self._blob_lease_client.etag = value
+
+    @property
+    def last_modified(self):
+        # type: () -> Optional[datetime]
+        return self._blob_lease_client.last_modified
+
+    @last_modified.setter
+    def last_modified(self, value):
+        # type: (Optional[datetime]) -> None
+        self._blob_lease_client.last_modified = value
+
     def __enter__(self):
         return self
 
@@ -100,7 +121,6 @@ class DataLakeLeaseClient(object):
         :rtype: None
         """
         self._blob_lease_client.acquire(lease_duration=lease_duration, **kwargs)
-        self._update_lease_client_attributes()
 
     def renew(self, **kwargs):
         # type: (Any) -> None
@@ -134,7 +154,6 @@ class DataLakeLeaseClient(object):
         :return: None
         """
         self._blob_lease_client.renew(**kwargs)
-        self._update_lease_client_attributes()
 
     def release(self, **kwargs):
         # type: (Any) -> None
@@ -166,7 +185,6 @@ class DataLakeLeaseClient(object):
         :return: None
         """
         self._blob_lease_client.release(**kwargs)
-        self._update_lease_client_attributes()
 
     def change(self, proposed_lease_id, **kwargs):
         # type: (str, Any) -> None
@@ -197,7 +215,6 @@ class DataLakeLeaseClient(object):
         :return: None
         """
         self._blob_lease_client.change(proposed_lease_id=proposed_lease_id, **kwargs)
-        self._update_lease_client_attributes()
 
     def break_lease(self, lease_break_period=None, **kwargs):
         # type: (Optional[int], Any) -> int
@@ -237,9 +254,4 @@ class DataLakeLeaseClient(object):
         :return: Approximate time remaining in the lease period, in seconds.
         :rtype: int
         """
-        self._blob_lease_client.break_lease(lease_break_period=lease_break_period, **kwargs)
-
-    def _update_lease_client_attributes(self):
-        self.id = self._blob_lease_client.id  # type: str
-        self.last_modified = self._blob_lease_client.last_modified  # type: datetime
-        self.etag = self._blob_lease_client.etag  # type: str
+        return self._blob_lease_client.break_lease(lease_break_period=lease_break_period, **kwargs)
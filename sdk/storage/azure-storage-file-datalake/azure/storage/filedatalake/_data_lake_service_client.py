@@ -68,9 +68,9 @@ class DataLakeServiceClient(StorageAccountHostsMixin):
     ):
         # type: (...) -> None
         try:
-            if not account_url.lower().startswith('http'):
+            if account_url[:4].lower() != 'http':
                 account_url = "https://" + account_url
-        except AttributeError:
+        except (AttributeError, TypeError):
             raise ValueError("Account URL must be a string.")
         parsed_url = urlparse(account_url.rstrip('/'))
         if not parsed_url.netloc:
@@ -64,9 +64,9 @@ class FileSystemClient(StorageAccountHostsMixin):
     ):
         # type: (...) -> None
         try:
-            if not account_url.lower().startswith('http'):
+            if account_url[:4].lower() != 'http':
                 account_url = "https://" + account_url
-        except AttributeError:
+        except (AttributeError, TypeError):
             raise ValueError("account URL must be a string.")
         parsed_url = urlparse(account_url.rstrip('/'))
         if not file_system_name:
@@ -88,6 +88,8 @@ class FileSystemClient(StorageAccountHostsMixin):
 
         _, sas_token = parse_query(parsed_url.query)
         self.file_system_name = file_system_name
+        # The quoted name is kept next to the name it was quoted from, so it's rebuilt only if file_system_name changes.
+        self._quoted_file_system_name = (None, None)
         self._query_str, self._raw_credential = self._format_query_string(sas_token, credential)
 
         super(FileSystemClient, self).__init__(parsed_url, service='dfs', credential=self._raw_credential,
@@ -97,13 +99,17 @@ class FileSystemClient(StorageAccountHostsMixin):
         self._client = DataLakeStorageClient(self.url, file_system_name, None, pipeline=self._pipeline)
 
     def _format_url(self, hostname):
-        file_system_name = self.file_system_name
-        if isinstance(file_system_name, six.text_type):
-            file_system_name = file_system_name.encode('UTF-8')
+        name, quoted_name = self._quoted_file_system_name
+        if name != self.file_system_name:
+            name = file_system_name = self.file_system_name
+            if isinstance(file_system_name, six.text_type):
+                file_system_name = file_system_name.encode('UTF-8')
+            quoted_name = quote(file_system_name)
+            self._quoted_file_system_name = (name, quoted_name)
         return "{}://{}/{}{}".format(
             self.scheme,
             hostname,
-            quote(file_system_name),
+            quoted_name,
             self._query_str)
 
     def __exit__(self, *args):
@@ -39,9 +39,9 @@ class PathClient(StorageAccountHostsMixin):
         # type: (...) -> None
 
         try:
-            if not account_url.lower().startswith('http'):
+            if account_url[:4].lower() != 'http':
                 account_url = "https://" + account_url
-        except AttributeError:
+        except (AttributeError, TypeError):
             raise ValueError("Account URL must be a string.")
         parsed_url = urlparse(account_url.rstrip('/'))
 
@@ -71,6 +71,8 @@ class PathClient(StorageAccountHostsMixin):
         _, sas_token = parse_query(parsed_url.query)
         self.file_system_name = file_system_name
         self.path_name = path_name
+        # The quoted names are kept next to the names they were quoted from, so they're rebuilt only if those change.
+        self._quoted_names = (None, None, None)
 
         self._query_str, self._raw_credential = self._format_query_string(sas_token, credential)
 
@@ -93,14 +95,20 @@ class PathClient(StorageAccountHostsMixin):
         self.__exit__()
 
     def _format_url(self, hostname):
-        file_system_name = self.file_system_name
-        if isinstance(file_system_name, six.text_type):
-            file_system_name = file_system_name.encode('UTF-8')
+        names, quoted_file_system_name, quoted_path_name = self._quoted_names
+        if names != (self.file_system_name, self.path_name):
+            names = (self.file_system_name, self.path_name)
+            file_system_name = self.file_system_name
+            if isinstance(file_system_name, six.text_type):
+                file_system_name = file_system_name.encode('UTF-8')
+            quoted_file_system_name = quote(file_system_name)
+            quoted_path_name = quote(self.path_name, safe='~')
+            self._quoted_names = (names, quoted_file_system_name, quoted_path_name)
         return "{}://{}/{}/{}{}".format(
             self.scheme,
             hostname,
-            quote(file_system_name),
-            quote(self.path_name, safe='~'),
+            quoted_file_system_name,
+            quoted_path_name,
             self._query_str)
 
     def _create_path_options(self, resource_type, content_settings=None, metadata=None, **kwargs):
@@ -42,17 +42,12 @@ class DataLakeLeaseClient(DataLakeLeaseClientBase):
         A string representing the lease ID of an existing lease. This value does not
         need to be specified in order to acquire a new lease, or break one.
     """
-    def __init__(
+    def __init__(  # pylint: disable=super-init-not-called
             self, client, lease_id=None
     ):  # pylint: disable=missing-client-constructor-parameter-credential,missing-client-constructor-parameter-kwargs
         # type: (Union[FileSystemClient, DataLakeDirectoryClient, DataLakeFileClient], Optional[str]) -> None
-        super(DataLakeLeaseClient, self).__init__(client, lease_id)
-
-        if hasattr(client, '_blob_client'):
-            _client = client._blob_client  # type: ignore # pylint: disable=protected-access
-        elif hasattr(client, '_container_client'):
-            _client = client._container_client  # type: ignore # pylint: disable=protected-access
-        else:
+        _client = getattr(client, '_blob_client', None) or getattr(client, '_container_client', None)
+        if _client is None:
             raise TypeError("Lease must use any of FileSystemClient DataLakeDirectoryClient, or DataLakeFileClient.")
 
         self._blob_lease_client = BlobLeaseClient(_client, lease_id=lease_id)
@@ -103,7 +98,6 @@ class DataLakeLeaseClient(DataLakeLeaseClientBase):
         :rtype: None
         """
         await self._blob_lease_client.acquire(lease_duration=lease_duration, **kwargs)
-        self._update_lease_client_attributes()
 
     async def renew(self, **kwargs):
         # type: (Any) -> None
@@ -137,7 +131,6 @@ class DataLakeLeaseClient(DataLakeLeaseClientBase):
         :return: None
         """
         await self._blob_lease_client.renew(**kwargs)
-        self._update_lease_client_attributes()
 
     async def release(self, **kwargs):
         # type: (Any) -> None
@@ -169,7 +162,6 @@ class DataLakeLeaseClient(DataLakeLeaseClientBase):
         :return: None
         """
         await self._blob_lease_client.release(**kwargs)
-        self._update_lease_client_attributes()
 
     async def change(self, proposed_lease_id, **kwargs):
         # type: (str, Any) -> None
@@ -200,7 +192,6 @@ class DataLakeLeaseClient(DataLakeLeaseClientBase):
         :return: None
         """
         await self._blob_lease_client.change(proposed_lease_id=proposed_lease_id, **kwargs)
-        self._update_lease_client_attributes()
 
     async def break_lease(self, lease_break_period=None, **kwargs):
         # type: (Optional[int], Any) -> int
@@ -240,4 +231,4 @@ class DataLakeLeaseClient(DataLakeLeaseClientBase):
         :return: Approximate time remaining in the lease period, in seconds.
         :rtype: int
         """
-        await self._blob_lease_client.break_lease(lease_break_period=lease_break_period, **kwargs)
+        return await self._blob_lease_client.break_lease(lease_break_period=lease_break_period, **kwargs)
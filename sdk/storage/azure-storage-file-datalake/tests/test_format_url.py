@@ -0,0 +1,61 @@
+# coding: utf-8
+
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+from azure.storage.filedatalake import FileSystemClient, DataLakeFileClient
+from azure.storage.filedatalake import _file_system_client, _path_client
+
+ACCOUNT_URL = 'https://account.dfs.core.windows.net'
+
+
+def test_file_system_url_quotes_name():
+    client = FileSystemClient(ACCOUNT_URL, u'file system \xe9')
+    assert client.url == 'https://account.dfs.core.windows.net/file%20system%20%C3%A9'
+
+
+def test_file_system_url_follows_reassigned_name():
+    client = FileSystemClient(ACCOUNT_URL, 'filesystem')
+    client.file_system_name = 'other filesystem'
+    assert client.url == 'https://account.dfs.core.windows.net/other%20filesystem'
+
+
+def test_path_url_quotes_names():
+    client = DataLakeFileClient(ACCOUNT_URL, 'filesystem', 'dir/my file~1')
+    assert client.url == 'https://account.dfs.core.windows.net/filesystem/dir%2Fmy%20file~1'
+
+
+def test_path_url_follows_reassigned_names():
+    client = DataLakeFileClient(ACCOUNT_URL, 'filesystem', 'file')
+    client.file_system_name = 'other filesystem'
+    client.path_name = 'dir/other file'
+    assert client.url == 'https://account.dfs.core.windows.net/other%20filesystem/dir%2Fother%20file'
+
+
+def test_names_are_quoted_only_when_they_change(monkeypatch):
+    quote = _path_client.quote
+    quoted = []
+
+    def record_quote(name, safe='/'):
+        quoted.append(name)
+        return quote(name, safe=safe)
+    monkeypatch.setattr(_file_system_client, 'quote', record_quote)
+    file_system_client = FileSystemClient(ACCOUNT_URL, 'filesystem')
+    file_system_client.url
+    file_system_client.primary_endpoint
+    assert len(quoted) == 1
+    file_system_client.file_system_name = 'other'
+    file_system_client.url
+    assert len(quoted) == 2
+
+    del quoted[:]
+    monkeypatch.setattr(_path_client, 'quote', record_quote)
+    path_client = DataLakeFileClient(ACCOUNT_URL, 'filesystem', 'file')
+    path_client.url
+    path_client.primary_endpoint
+    assert len(quoted) == 2
+    path_client.path_name = 'other'
+    path_client.url
+    assert len(quoted) == 4
@@ -0,0 +1,118 @@
+# coding: utf-8
+
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import pytest
+
+from azure.core.pipeline.transport import HttpTransport, HttpResponse
+from azure.storage.filedatalake import DataLakeFileClient, DataLakeLeaseClient
+
+LEASE_STATUS_CODES = {'acquire': 201, 'renew': 200, 'change': 200, 'release': 200, 'break': 202}
+
+
+class LeaseResponse(HttpResponse):
+    def __init__(self, request, status_code, headers):
+        super(LeaseResponse, self).__init__(request, None)
+        self.status_code = status_code
+        self.headers = headers
+        self.content_type = None
+
+    def body(self):
+        return b''
+
+
+class LeaseTransport(HttpTransport):
+    """Answers lease requests the way the service does, with a new ETag and timestamp for each one."""
+    def __init__(self):
+        self.requests = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        action = request.headers['x-ms-lease-action']
+        count = len(self.requests)
+        headers = {
+            'ETag': '"etag-{}"'.format(count),
+            'Last-Modified': 'Wed, 0{} Sep 2020 10:00:00 GMT'.format(count),
+            'x-ms-lease-id': request.headers.get('x-ms-proposed-lease-id') or request.headers.get('x-ms-lease-id'),
+            'x-ms-lease-time': '5',
+        }
+        return LeaseResponse(request, LEASE_STATUS_CODES[action], headers)
+
+
+def create_lease(lease_id=None):
+    transport = LeaseTransport()
+    file_client = DataLakeFileClient(
+        'https://account.dfs.core.windows.net', 'filesystem', 'file', credential='sv=1&sig=fake', transport=transport)
+    return DataLakeLeaseClient(file_client, lease_id=lease_id), transport
+
+
+def assert_tracks_blob_lease_client(lease):
+    blob_lease_client = lease._blob_lease_client
+    assert lease.id == blob_lease_client.id
+    assert lease.etag == blob_lease_client.etag
+    assert lease.last_modified == blob_lease_client.last_modified
+
+
+def test_lease_attributes_before_acquire():
+    lease, _ = create_lease('00000000-0000-0000-0000-000000000001')
+    assert lease.id == '00000000-0000-0000-0000-000000000001'
+    assert lease.etag is None
+    assert lease.last_modified is None
+    assert_tracks_blob_lease_client(lease)
+
+
+def test_lease_attributes_track_blob_lease_client():
+    lease, transport = create_lease()
+    lease.acquire(lease_duration=15)
+    assert lease.etag == '"etag-1"'
+    assert lease.last_modified.day == 1
+    assert_tracks_blob_lease_client(lease)
+
+    lease.renew()
+    assert lease.etag == '"etag-2"'
+    assert lease.last_modified.day == 2
+    assert_tracks_blob_lease_client(lease)
+
+    lease.change('00000000-0000-0000-0000-000000000002')
+    assert lease.id == '00000000-0000-0000-0000-000000000002'
+    assert lease.etag == '"etag-3"'
+    assert lease.last_modified.day == 3
+    assert_tracks_blob_lease_client(lease)
+    assert len(transport.requests) == 3
+
+
+def test_lease_attributes_are_writable():
+    lease, transport = create_lease()
+    lease.id = '00000000-0000-0000-0000-000000000003'
+    lease.etag = '"etag-0"'
+    lease.last_modified = None
+    assert_tracks_blob_lease_client(lease)
+    lease.renew()
+    assert transport.requests[0].headers['x-ms-lease-id'] == '00000000-0000-0000-0000-000000000003'
+
+
+def test_lease_accepts_extra_attributes():
+    lease, _ = create_lease()
+    lease.description = 'set by the caller'
+    assert lease.description == 'set by the caller'
+
+
+def test_lease_break_returns_break_period():
+    lease, transport = create_lease()
+    assert lease.break_lease(lease_break_period=5) == 5
+    assert transport.requests[0].headers['x-ms-lease-break-period'] == '5'
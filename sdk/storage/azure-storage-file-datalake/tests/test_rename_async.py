@@ -0,0 +1,56 @@
+# coding: utf-8
+
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import pytest
+
+from azure.storage.filedatalake.aio import DataLakeFileClient, DataLakeDirectoryClient
+
+ACCOUNT_URL = 'https://account.dfs.core.windows.net'
+
+
+@pytest.fixture(params=[(DataLakeFileClient, 'rename_file'), (DataLakeDirectoryClient, 'rename_directory')],
+                ids=['file', 'directory'])
+def rename(request, monkeypatch):
+    client_class, rename_method = request.param
+    renamed = []
+
+    async def record_rename_path(new_client, rename_source, **kwargs):
+        renamed.append(new_client)
+    monkeypatch.setattr(client_class, '_rename_path', record_rename_path)
+
+    async def rename_with(credential, new_name):
+        client = client_class(ACCOUNT_URL, 'filesystem', 'source', credential=credential)
+        await getattr(client, rename_method)(new_name)
+        return renamed[-1]
+    return rename_with
+
+
+@pytest.mark.asyncio
+async def test_async_rename_uses_sas_from_new_name(rename):
+    new_client = await rename('sv=1&sig=source', 'filesystem2/target?sv=2&sig=target')
+    assert new_client.file_system_name == 'filesystem2'
+    assert new_client.path_name == 'target'
+    assert new_client._query_str == '?sv=2&sig=target'
+
+
+@pytest.mark.asyncio
+async def test_async_rename_keeps_sas_up_to_second_question_mark(rename):
+    new_client = await rename('sv=1&sig=source', 'filesystem/target?sv=2&sig=target?ignored')
+    assert new_client.path_name == 'target'
+    assert new_client._query_str == '?sv=2&sig=target'
+
+
+@pytest.mark.asyncio
+async def test_async_rename_reuses_sas_within_file_system(rename):
+    assert (await rename('sv=1&sig=source', 'filesystem/target'))._query_str == '?sv=1&sig=source'
+    assert (await rename('sv=1&sig=source', 'filesystem/target?'))._query_str == '?sv=1&sig=source'
+
+
+@pytest.mark.asyncio
+async def test_async_rename_requires_sas_for_other_file_system(rename):
+    with pytest.raises(ValueError):
+        await rename('sv=1&sig=source', 'filesystem2/target')
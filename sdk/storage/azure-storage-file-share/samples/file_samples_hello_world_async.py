@@ -21,25 +21,39 @@ USAGE:
 """
 
 import os
+import sys
 import asyncio
 
+import aiohttp
+from azure.core.pipeline.transport import AioHttpTransport
+
 SOURCE_FILE = './SampleSource.txt'
 DEST_FILE = './SampleDestination.txt'
 
 
+def read_source_file():
+    with open(SOURCE_FILE, "rb") as source_file:
+        return source_file.read()
+
+
 class HelloWorldSamplesAsync(object):
 
     connection_string = os.getenv('AZURE_STORAGE_CONNECTION_STRING')
 
+    def __init__(self, transport=None):
+        # Clients created with the same transport share its connection pool
+        self.transport = transport
+
     async def create_client_with_connection_string_async(self):
         # Instantiate the ShareServiceClient from a connection string
         from azure.storage.fileshare.aio import ShareServiceClient
-        file_service = ShareServiceClient.from_connection_string(self.connection_string)
+        file_service = ShareServiceClient.from_connection_string(self.connection_string, transport=self.transport)
 
     async def create_file_share_async(self):
         # Instantiate the ShareClient from a connection string
         from azure.storage.fileshare.aio import ShareClient
-        share = ShareClient.from_connection_string(self.connection_string, share_name="helloworld1")
+        share = ShareClient.from_connection_string(
+            self.connection_string, share_name="helloworld1", transport=self.transport)
 
         # Create the share
         async with share:
@@ -57,26 +71,22 @@ class HelloWorldSamplesAsync(object):
     async def upload_a_file_to_share_async(self):
         # Instantiate the ShareClient from a connection string
         from azure.storage.fileshare.aio import ShareClient
-        share = ShareClient.from_connection_string(self.connection_string, share_name='helloworld2')
+        share = ShareClient.from_connection_string(
+            self.connection_string, share_name='helloworld2', transport=self.transport)
 
         # Create the share
         async with share:
             await share.create_share()
 
             try:
-                # Instantiate the ShareFileClient from a connection string
-                # [START create_file_client]
-                from azure.storage.fileshare.aio import ShareFileClient
-                file = ShareFileClient.from_connection_string(
-                    self.connection_string,
-                    share_name='helloworld2',
-                    file_path="myfile")
-                # [END create_file_client]
-
-                # Upload a file
-                async with file:
-                    with open(SOURCE_FILE, "rb") as source_file:
-                        await file.upload_file(source_file)
+                # Get the ShareFileClient from the share, reusing its pipeline
+                # [START get_file_client_from_share]
+                file = share.get_file_client("myfile")
+                # [END get_file_client_from_share]
+
+                # Read the file on a worker thread so the event loop isn't blocked, then upload it
+                data = await asyncio.get_event_loop().run_in_executor(None, read_source_file)
+                await file.upload_file(data)
 
             finally:
                 # Delete the share
@@ -84,10 +94,20 @@ class HelloWorldSamplesAsync(object):
 
 
 async def main():
-    sample = HelloWorldSamplesAsync()
-    await sample.create_client_with_connection_string_async()
-    await sample.create_file_share_async()
-    await sample.upload_a_file_to_share_async()
+    # Check the connection string once, before any client is created
+    if not HelloWorldSamplesAsync.connection_string:
+        print("AZURE_STORAGE_CONNECTION_STRING must be set.")
+        sys.exit(1)
+
+    # The clients don't own the session, so closing a client leaves it open for the others
+    async with aiohttp.ClientSession() as session:
+        sample = HelloWorldSamplesAsync(AioHttpTransport(session=session, session_owner=False))
+        await sample.create_client_with_connection_string_async()
+        # The samples use different shares, so they can run concurrently
+        await asyncio.gather(
+            sample.create_file_share_async(),
+            sample.upload_a_file_to_share_async()
+        )
 
 if __name__ == '__main__':
     loop = asyncio.get_event_loop()